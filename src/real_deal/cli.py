@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import time
+import asyncio
 from datetime import datetime
 from pathlib import Path
 
@@ -12,19 +12,41 @@ from typing import Optional
 # Load .env from project root
 load_dotenv(Path(__file__).resolve().parent.parent.parent / ".env")
 
+import httpx
 import typer
 from rich.console import Console
 from rich.table import Table
 
 from collections import defaultdict
 
-from .config import get_all_cities, get_city_province_map, get_export_min_cashflow_monthly, load_config
-from .connectors import RapidAPIRealtorConnector, RapidAPIRedfinConnector
+from .config import (
+    get_all_cities,
+    get_circuit_breaker_params,
+    get_city_province_map,
+    get_export_min_cashflow_monthly,
+    get_http_client_params,
+    get_rate_limit,
+    get_retry_policy,
+    load_config,
+)
+from .connectors import (
+    CityFetchStats,
+    ConnectorResult,
+    ListingConnector,
+    RapidAPIRealtorConnector,
+    RapidAPIRedfinConnector,
+)
+from .connectors.cache import ResponseCache
+from .connectors.http import build_async_client
+from .connectors.rate_limit import get_host_limiter
+from .connectors.replay import ReplayConnector, ResponseRecorder
+from .connectors.retry import get_circuit_breaker
 from .filters import filter_listings
 from .listing_classification import is_land_from_listing
 from .listing_utils import dedupe_listings
+from .parallel import default_workers, underwrite_parallel
 from .storage import Storage, export_csv, export_json
-from .underwriting import UnderwritingEngine
+from .underwriting import SignalCache, UnderwritingEngine
 from .land import LandUnderwritingEngine
 from .land.detection import is_land_candidate
 from .land.mocks import run_mock_underwriting
@@ -46,11 +68,119 @@ def _get_storage() -> Storage:
     return Storage(_get_output_dir() / "real_deal.duckdb")
 
 
+def _get_response_cache(cfg: dict, use_cache: bool = True, refresh: bool = False) -> ResponseCache | None:
+    """HTTP response cache from data_source.cache; None when disabled."""
+    cache_cfg = cfg.get("data_source", {}).get("cache", {})
+    if not use_cache or not isinstance(cache_cfg, dict) or not cache_cfg.get("enabled", True):
+        return None
+    ttls = dict(cache_cfg.get("ttl_seconds") or {})
+    default_ttl = float(ttls.pop("default", 3600))
+    return ResponseCache(
+        cache_cfg.get("path") or _get_output_dir() / "http_cache.sqlite",
+        ttl_seconds={k: float(v) for k, v in ttls.items()},
+        default_ttl=default_ttl,
+        mode="refresh" if refresh else "use",
+    )
+
+
+def _resolve_cities(cfg: dict, cities_only: Optional[str], limit: Optional[int] = None) -> list[str]:
+    """Cities from --cities (city and/or tier names) or all configured tiers, capped by --limit."""
+    if isinstance(cities_only, str):
+        parts = [c.strip() for c in cities_only.split(",") if c.strip()]
+        all_tier_names = set(cfg.get("cities", {}).keys())
+        # Check if all parts are tier names
+        if all(p in all_tier_names for p in parts):
+            cities = get_all_cities(cfg, tiers=tuple(parts))
+        elif any(p in all_tier_names for p in parts):
+            # Mix of tier names and city names
+            tiers = [p for p in parts if p in all_tier_names]
+            explicit = [p for p in parts if p not in all_tier_names]
+            cities = get_all_cities(cfg, tiers=tuple(tiers)) + explicit
+        else:
+            cities = parts
+        console.print(f"[dim]Using cities: {cities}[/dim]")
+    else:
+        cities = get_all_cities(cfg)
+    if isinstance(limit, int) and limit > 0:
+        cities = cities[:limit]
+        console.print(f"[dim]Limited to {limit} cities for testing[/dim]")
+    return cities
+
+
+def _group_by_province(cfg: dict, cities: list[str]) -> dict[str, list[str]]:
+    """Group cities by province so each province is fetched with the correct filter."""
+    default_province = cfg.get("province", "ON")
+    city_prov_map = get_city_province_map(cfg)
+    province_groups: dict[str, list[str]] = defaultdict(list)
+    for city in cities:
+        province_groups[city_prov_map.get(city, default_province)].append(city)
+    return province_groups
+
+
+def _print_fetch_stats(city_stats: list[CityFetchStats]) -> None:
+    """One-line summary of per-city fetch outcomes (requests, retries, failures)."""
+    if not city_stats:
+        return
+    by_status: dict[str, int] = defaultdict(int)
+    for st in city_stats:
+        by_status[st.status] += 1
+    outcome = ", ".join(f"{n} {status}" for status, n in sorted(by_status.items()))
+    shared = sum(1 for st in city_stats if st.shared_with)
+    console.print(
+        f"[dim]City fetches: {outcome} | "
+        f"{sum(st.requests for st in city_stats)} requests, "
+        f"{sum(st.retries for st in city_stats)} retries, "
+        f"{sum(st.cache_hits for st in city_stats)} cache hits"
+        + (f", {shared} cities served by a shared search" if shared else "")
+        + "[/dim]"
+    )
+
+
+async def _fetch_sources(
+    connectors: list[tuple[str, ListingConnector]],
+    province_groups: dict[str, list[str]],
+    max_price: float,
+    client: httpx.AsyncClient,
+    recorder: ResponseRecorder | None = None,
+) -> list[ConnectorResult]:
+    """
+    Fetch every source concurrently; province groups run in turn within a source.
+
+    Progress is reported as each (source, province) pass completes. Results come
+    back in source then province order so downstream dedupe stays deterministic.
+    *client* is the run's shared pool and is closed once every source is done.
+    Every normalised page is appended to *recorder* (if any) for offline replay.
+    """
+
+    async def run_source(label: str, conn: ListingConnector) -> list[ConnectorResult]:
+        results: list[ConnectorResult] = []
+        for province, prov_cities in province_groups.items():
+            console.print(f"[bold]Fetching from {label} for {len(prov_cities)} cities ({province})...[/bold]")
+            on_page = None
+            if recorder is not None:
+                on_page = lambda page, src=conn.source_name: recorder.record(src, page, max_price)
+            result = await conn.fetch_async(
+                cities=prov_cities, max_price=max_price, province=province, on_page=on_page
+            )
+            console.print(f"[dim]{label} ({province}): {len(result.listings)} listings[/dim]")
+            results.append(result)
+        return results
+
+    async with client:
+        per_source = await asyncio.gather(*(run_source(label, conn) for label, conn in connectors))
+    return [result for results in per_source for result in results]
+
+
 def _run_id() -> str:
     """Generate run ID from timestamp."""
     return datetime.utcnow().strftime("%Y%m%d_%H%M%S")
 
 
+def _resolve_workers(workers: int) -> int:
+    """--workers value to a process count (0 = all usable CPUs)."""
+    return default_workers() if workers <= 0 else workers
+
+
 def _filter_cashflow_band(results: list, min_cashflow: float) -> list:
     """Keep deals with base-case monthly cashflow >= min_cashflow (e.g. -500 drawdown)."""
     return [
@@ -130,85 +260,190 @@ def _display_report(
         console.print(f"\n[dim]Full details: {json_path}[/dim]")
 
 
+def _fetch_live(
+    cfg: dict,
+    connector_type: str,
+    province_groups: dict[str, list[str]],
+    max_price: float,
+    min_price: float,
+    cache: bool,
+    refresh: bool,
+    run_id: str,
+) -> tuple[list, list[str], dict[str, list[str]]]:
+    """
+    Fetch *province_groups* from the configured RapidAPI source(s).
+
+    Returns (listings, errors, complete) where *complete* maps each source to
+    the cities it fetched without errors (safe scope for marking removals).
+    """
+    ds = cfg.get("data_source", {})
+    response_cache = _get_response_cache(cfg, use_cache=cache, refresh=refresh)
+    recorder = (
+        ResponseRecorder(_get_output_dir() / "raw" / f"responses_{run_id}.jsonl")
+        if ds.get("record_responses", True)
+        else None
+    )
+    delay = float(ds.get("delay_seconds", 2.0))
+    max_concurrency = int(ds.get("max_concurrency", 8))
+    per_host_concurrency = int(ds.get("per_host_concurrency", 4))
+    retry_policy = get_retry_policy(cfg)
+    breaker_params = get_circuit_breaker_params(cfg)
+    pagination = ds.get("pagination", {}) or {}
+
+    # One pooled keep-alive client for the whole run: TLS/connection setup is paid once per host
+    http_client = build_async_client(**get_http_client_params(cfg))
+
+    all_listings: list = []
+    all_errors: list[str] = []
+    all_city_stats: list[CityFetchStats] = []
+    complete: dict[str, list[str]] = {}
+
+    region_ids: dict[tuple[str, str], str] = {}
+    new_region_ids: dict[tuple[str, str], str] = {}
+    if connector_type in ("redfin", "both"):
+        storage = _get_storage()
+        region_ids = storage.load_region_ids(float(ds.get("region_id_ttl_days", 180)))
+        storage.close()
+
+    connectors: list[tuple[str, ListingConnector]] = []
+    redfin_conn: RapidAPIRedfinConnector | None = None
+    if connector_type in ("realtor", "both"):
+        host = ds.get("rapidapi_host", "realtor-ca-scraper-api.p.rapidapi.com")
+        property_type_group_id = str(ds.get("property_type_group_id", "1") or "")
+        bounding_box_delta = float(ds.get("bounding_box_delta", 0.15))
+        zoom_level = str(ds.get("zoom_level", "10"))
+        tiling = ds.get("tiling", {}) or {}
+        realtor_conn = RapidAPIRealtorConnector(
+            host=host,
+            delay_seconds=delay,
+            min_price=min_price,
+            property_type_group_id=property_type_group_id,
+            bounding_box_delta=bounding_box_delta,
+            zoom_level=zoom_level,
+            page_size=int(pagination.get("realtor_page_size", 200)),
+            max_pages=int(pagination.get("max_pages", 10)),
+            tile_max_depth=int(tiling.get("max_depth", 2)),
+            tile_merge_overlap=float(tiling.get("merge_overlap", 0.5)),
+            max_concurrency=max_concurrency,
+            per_host_concurrency=per_host_concurrency,
+            # Shared per-host bucket: pacing carries over between province groups
+            rate_limiter=get_host_limiter(host, *get_rate_limit(cfg, host)),
+            cache=response_cache,
+            retry_policy=retry_policy,
+            circuit_breaker=get_circuit_breaker(host, *breaker_params),
+            client=http_client,
+            base_url=ds.get("realtor_base_url") or None,
+        )
+        connectors.append(("Realtor.ca", realtor_conn))
+
+    if connector_type in ("redfin", "both"):
+        host = ds.get("redfin_host", "redfin-canada.p.rapidapi.com")
+        redfin_conn = RapidAPIRedfinConnector(
+            host=host,
+            delay_seconds=delay,
+            min_price=min_price,
+            max_concurrency=max_concurrency,
+            per_host_concurrency=per_host_concurrency,
+            rate_limiter=get_host_limiter(host, *get_rate_limit(cfg, host)),
+            cache=response_cache,
+            retry_policy=retry_policy,
+            circuit_breaker=get_circuit_breaker(host, *breaker_params),
+            region_ids=region_ids,
+            client=http_client,
+            base_url=ds.get("redfin_base_url") or None,
+            page_size=int(pagination.get("redfin_page_size", 350)),
+            max_pages=int(pagination.get("max_pages", 10)),
+        )
+        connectors.append(("Redfin Canada", redfin_conn))
+
+    # Sources hit different hosts with independent quotas, so they run side by side
+    for conn_result in asyncio.run(
+        _fetch_sources(connectors, province_groups, max_price, http_client, recorder)
+    ):
+        all_listings.extend(conn_result.listings)
+        all_errors.extend(conn_result.errors)
+        all_city_stats.extend(conn_result.city_stats)
+        # Only fully fetched cities may mark unseen listings as removed ("partial" is excluded)
+        complete.setdefault(conn_result.source, []).extend(
+            st.city for st in conn_result.city_stats if st.status == "ok" and not st.error
+        )
+    if redfin_conn is not None:
+        new_region_ids.update(redfin_conn.new_region_ids)
+
+    if new_region_ids:
+        storage = _get_storage()
+        storage.save_region_ids(new_region_ids)
+        storage.close()
+        console.print(f"[dim]Cached {len(new_region_ids)} new Redfin regionIds[/dim]")
+
+    _print_fetch_stats(all_city_stats)
+    if response_cache is not None:
+        console.print(
+            f"[dim]Response cache: {response_cache.hits} hits, {response_cache.misses} misses[/dim]"
+        )
+        response_cache.close()
+    if recorder is not None:
+        recorder.close()
+        if recorder.pages:
+            console.print(f"[dim]Recorded {recorder.pages} API response pages to {recorder.path}[/dim]")
+    return all_listings, all_errors, complete
+
+
+def _keyword_filters(cfg: dict) -> tuple[list[str], list[str]]:
+    """(include, exclude) keywords from config; include is empty unless require_include_match."""
+    kw = cfg.get("keyword_filters", {})
+    include = kw.get("include", []) if kw.get("require_include_match", True) else []
+    return include, kw.get("exclude", [])
+
+
+def _fetch_replay(
+    replay: Path,
+    province_groups: dict[str, list[str]],
+    max_price: float,
+    min_price: float,
+) -> tuple[list, list[str]]:
+    """Re-normalise recorded API responses (no network); returns (listings, errors)."""
+    conn = ReplayConnector(replay, min_price=min_price)
+    listings: list = []
+    errors: list[str] = []
+    for province, prov_cities in province_groups.items():
+        result = conn.fetch(cities=prov_cities, max_price=max_price, province=province)
+        listings.extend(result.listings)
+        errors.extend(result.errors)
+    console.print(f"[bold]Replayed {len(listings)} listings from {replay}[/bold]")
+    return listings, errors
+
+
 @app.command()
 def fetch(
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config.yaml"),
     limit: Optional[int] = typer.Option(None, "--limit", "-n", help="Limit number of cities (for testing)"),
     cities_only: Optional[str] = typer.Option(None, "--cities", "-C", help="Comma-separated cities or tier names (e.g. tier_1,tier_2,bruce_county)"),
     source: Optional[str] = typer.Option(None, "--source", "-s", help="Override connector: realtor, redfin, or both"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Serve repeat API calls from the on-disk response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses, re-fetch and overwrite them"),
+    replay: Optional[Path] = typer.Option(None, "--replay", help="Replay raw API dumps (file or output/raw dir) instead of calling the API"),
 ) -> None:
-    """Fetch listings from data source and store raw data."""
+    """Fetch listings from data source (or replay a raw response dump) and store them."""
     cfg = load_config(config_path)
-    if isinstance(cities_only, str):
-        parts = [c.strip() for c in cities_only.split(",") if c.strip()]
-        all_tier_names = set(cfg.get("cities", {}).keys())
-        # Check if all parts are tier names
-        if all(p in all_tier_names for p in parts):
-            cities = get_all_cities(cfg, tiers=tuple(parts))
-        elif any(p in all_tier_names for p in parts):
-            # Mix of tier names and city names
-            tiers = [p for p in parts if p in all_tier_names]
-            explicit = [p for p in parts if p not in all_tier_names]
-            cities = get_all_cities(cfg, tiers=tuple(tiers)) + explicit
-        else:
-            cities = parts
-        console.print(f"[dim]Using cities: {cities}[/dim]")
-    else:
-        cities = get_all_cities(cfg)
-    if isinstance(limit, int) and limit > 0:
-        cities = cities[:limit]
-        console.print(f"[dim]Limited to {limit} cities for testing[/dim]")
+    cities = _resolve_cities(cfg, cities_only, limit)
     ds = cfg.get("data_source", {})
     max_price = float(cfg.get("max_price", 550000))
     min_price = float(cfg.get("min_price", ds.get("min_price", 20000)))
-    default_province = cfg.get("province", "ON")
-
-    connector_type = str(source or ds.get("connector", "realtor")).lower()
-    delay = float(ds.get("delay_seconds", 2.0))
-
-    # Group cities by province so each province is fetched with the correct filter
-    city_prov_map = get_city_province_map(cfg)
-    province_groups: dict[str, list[str]] = defaultdict(list)
-    for city in cities:
-        prov = city_prov_map.get(city, default_province)
-        province_groups[prov].append(city)
-
-    all_listings: list = []
-    all_errors: list[str] = []
+    province_groups = _group_by_province(cfg, cities)
+    run_id = _run_id()
+    complete: dict[str, list[str]] = {}  # replays never mark listings removed
 
-    for province, prov_cities in province_groups.items():
-        if connector_type in ("realtor", "both"):
-            host = ds.get("rapidapi_host", "realtor-ca-scraper-api.p.rapidapi.com")
-            property_type_group_id = str(ds.get("property_type_group_id", "1") or "")
-            bounding_box_delta = float(ds.get("bounding_box_delta", 0.15))
-            zoom_level = str(ds.get("zoom_level", "10"))
-            realtor_conn = RapidAPIRealtorConnector(
-                host=host,
-                delay_seconds=delay,
-                min_price=min_price,
-                property_type_group_id=property_type_group_id,
-                bounding_box_delta=bounding_box_delta,
-                zoom_level=zoom_level,
-            )
-            console.print(f"[bold]Fetching from Realtor.ca for {len(prov_cities)} cities ({province})...[/bold]")
-            result = realtor_conn.fetch(cities=prov_cities, max_price=max_price, province=province)
-            all_listings.extend(result.listings)
-            all_errors.extend(result.errors)
-
-        if connector_type in ("redfin", "both"):
-            if connector_type == "both":
-                time.sleep(delay)
-            host = ds.get("redfin_host", "redfin-canada.p.rapidapi.com")
-            redfin_conn = RapidAPIRedfinConnector(
-                host=host,
-                delay_seconds=delay,
-                min_price=min_price,
-            )
-            console.print(f"[bold]Fetching from Redfin Canada for {len(prov_cities)} cities ({province})...[/bold]")
-            result = redfin_conn.fetch(cities=prov_cities, max_price=max_price, province=province)
-            all_listings.extend(result.listings)
-            all_errors.extend(result.errors)
+    if isinstance(replay, Path):
+        connector_type = "both"  # dumps can mix sources
+        all_listings, all_errors = _fetch_replay(replay, province_groups, max_price, min_price)
+    else:
+        connector_type = str(source or ds.get("connector", "realtor")).lower()
+        all_listings, all_errors, complete = _fetch_live(
+            cfg, connector_type, province_groups, max_price, min_price, cache, refresh, run_id
+        )
 
+    fetched_ids = {l.id for l in all_listings}  # before dedupe/filters: not removals
     if connector_type == "both":
         before = len(all_listings)
         all_listings = dedupe_listings(all_listings, prefer_source="rapidapi_redfin")
@@ -224,9 +459,7 @@ def fetch(
             console.print(f"[yellow]Warning: {e}[/yellow]")
 
     # Apply keyword filter
-    kw = cfg.get("keyword_filters", {})
-    include = kw.get("include", []) if kw.get("require_include_match", True) else []
-    exclude = kw.get("exclude", [])
+    include, exclude = _keyword_filters(cfg)
     filtered = filter_listings(result.listings, include, exclude, max_price, min_price=min_price)
 
     console.print(
@@ -234,57 +467,182 @@ def fetch(
         f"(${min_price:,.0f}–${max_price:,.0f})[/green]"
     )
 
-    if filtered:
+    if filtered or complete:
         storage = _get_storage()
-        storage.save_listings(filtered)
+        # Replayed dumps may be older than what is stored: add unseen listings only, no events
+        saved = storage.save_listings(
+            filtered, complete=complete, seen_ids=fetched_ids, insert_only=isinstance(replay, Path)
+        )
+        storage.close()
+        console.print(
+            f"[dim]Stored: {saved.new} new, {saved.changed} changed, "
+            f"{saved.unchanged} unchanged, {saved.removed} removed"
+            + (f", {saved.skipped} already stored (replay)" if saved.skipped else "")
+            + "[/dim]"
+        )
+    if filtered:
+        if isinstance(replay, Path):
+            return
         # Save raw payloads for debugging
         raw_dir = _get_output_dir() / "raw"
         raw_dir.mkdir(parents=True, exist_ok=True)
-        run_id = _run_id()
         raw_file = raw_dir / f"listings_{run_id}.json"
         import json as _json
         with open(raw_file, "w") as f:
             _json.dump([l.raw_payload for l in filtered], f, indent=2, default=str)
         console.print(f"[dim]Raw payloads saved to {raw_file}[/dim]")
-        storage.close()
     else:
         console.print("[yellow]No listings to save. Check RAPIDAPI_KEY in .env and API rate limits.[/yellow]")
 
 
+@app.command("warm-regions")
+def warm_regions(
+    config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config.yaml"),
+    cities_only: Optional[str] = typer.Option(None, "--cities", "-C", help="Comma-separated cities or tier names (default: all)"),
+    force: bool = typer.Option(False, "--force", help="Re-resolve cities that already have a cached regionId"),
+) -> None:
+    """Resolve and cache Redfin regionIds for configured cities (one auto-complete call each)."""
+    cfg = load_config(config_path)
+    ds = cfg.get("data_source", {})
+    cities = _resolve_cities(cfg, cities_only)
+    host = ds.get("redfin_host", "redfin-canada.p.rapidapi.com")
+    storage = _get_storage()
+    known = {} if force else storage.load_region_ids(float(ds.get("region_id_ttl_days", 180)))
+    storage.close()
+
+    http_client = build_async_client(**get_http_client_params(cfg))
+    conn = RapidAPIRedfinConnector(
+        host=host,
+        max_concurrency=int(ds.get("max_concurrency", 8)),
+        per_host_concurrency=int(ds.get("per_host_concurrency", 4)),
+        rate_limiter=get_host_limiter(host, *get_rate_limit(cfg, host)),
+        retry_policy=get_retry_policy(cfg),
+        circuit_breaker=get_circuit_breaker(host, *get_circuit_breaker_params(cfg)),
+        region_ids=known,
+        client=http_client,
+        base_url=ds.get("redfin_base_url") or None,
+    )
+    errors: list[str] = []
+
+    async def resolve_all() -> None:
+        async with http_client:
+            for province, prov_cities in _group_by_province(cfg, cities).items():
+                _, prov_errors = await conn.resolve_region_ids(prov_cities, province, force=force)
+                errors.extend(prov_errors)
+
+    asyncio.run(resolve_all())
+    resolved_total = len(conn.new_region_ids)
+    if conn.new_region_ids:
+        storage = _get_storage()
+        storage.save_region_ids(conn.new_region_ids)
+        storage.close()
+
+    for e in errors:
+        console.print(f"[yellow]Warning: {e}[/yellow]")
+    console.print(
+        f"[green]Resolved {resolved_total} regionIds via auto-complete "
+        f"({len(cities) - resolved_total - len(errors)} already cached)[/green]"
+    )
+
+
+@app.command("fake-api")
+def fake_api(
+    port: int = typer.Option(8765, "--port", "-p", help="Port to listen on"),
+    latency: float = typer.Option(0.05, "--latency", help="Seconds of latency added to every request"),
+    jitter: float = typer.Option(0.0, "--jitter", help="Extra random latency (0..jitter seconds)"),
+    throttle_rate: float = typer.Option(0.0, "--throttle-rate", help="Fraction of requests answered with 429"),
+    retry_after: float = typer.Option(1.0, "--retry-after", help="Retry-After seconds on injected 429s"),
+    realtor_page_size: int = typer.Option(200, "--realtor-page-size", help="Max RecordsPerPage for /properties/search"),
+    redfin_page_size: int = typer.Option(350, "--redfin-page-size", help="Results per page for /properties/search-sale"),
+    listings_per_city: int = typer.Option(120, "--listings-per-city", help="Synthetic listings generated per city"),
+    recorded: Optional[Path] = typer.Option(None, "--recorded", help="Serve items from raw dumps (file or output/raw dir) instead of synthetic ones"),
+) -> None:
+    """Serve a local stand-in for both RapidAPI hosts (set data_source.realtor_base_url / redfin_base_url to use it)."""
+    from .connectors.fake_api import FakeAPIConfig, FakeRapidAPIServer
+
+    server = FakeRapidAPIServer(
+        FakeAPIConfig(
+            latency_seconds=latency,
+            latency_jitter=jitter,
+            throttle_rate=throttle_rate,
+            retry_after=retry_after,
+            realtor_page_size=realtor_page_size,
+            redfin_page_size=redfin_page_size,
+            listings_per_city=listings_per_city,
+            recorded=recorded,
+        ),
+        port=port,
+    )
+    console.print(f"[bold]Fake RapidAPI listening on {server.base_url}[/bold] (stats at {server.base_url}/__stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        console.print(f"[dim]Requests served: {server.stats()}[/dim]")
+
+
 @app.command()
 def underwrite(
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to config.yaml"),
     sort: str = typer.Option("safety", "--sort", "-S", help="Sort by: safety (margin-of-safety), cashflow, coc (cash-on-cash), dscr"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for underwriting (0 = all CPUs)"),
+    full: bool = typer.Option(False, "--full", help="Recompute every listing instead of carrying forward unchanged results"),
 ) -> None:
     """Underwrite stored listings and save results."""
     cfg = load_config(config_path)
     storage = _get_storage()
     min_price = float(cfg.get("min_price", 0))
-    listings = storage.load_listings()
+    # Price floor, current keyword filters and delisted rows are applied in DuckDB,
+    # so keyword changes re-filter the stored corpus without a re-fetch
+    include, exclude = _keyword_filters(cfg)
+    listings = storage.load_listings(
+        min_price=min_price,
+        include_removed=False,
+        include_keywords=include,
+        exclude_keywords=exclude,
+    )
+    signal_cache = SignalCache.load(storage)
+    prior = {} if full else storage.load_prior_deals()
     storage.close()
     before = len(listings)
-    listings = [
-        l
-        for l in listings
-        if l.price >= min_price and not is_land_from_listing(l)
-    ]
+    listings = [l for l in listings if not is_land_from_listing(l)]
     dropped = before - len(listings)
     if dropped:
         console.print(
-            f"[dim]Excluded {dropped} listings (land/lots or price < ${min_price:,.0f})[/dim]"
+            f"[dim]Excluded {dropped} land/lot listings (price floor ${min_price:,.0f} and keywords applied in the query)[/dim]"
         )
 
     if not listings:
         console.print("[yellow]No listings in database. Run 'fetch' first.[/yellow]")
         raise typer.Exit(1)
 
-    engine = UnderwritingEngine(config=cfg)
-    results = engine.underwrite_many(listings)
+    cached_before = len(signal_cache)
+    # Listings whose inputs and relevant config are unchanged since the last run are
+    # carried forward (re-evaluated only if pass/fail thresholds changed)
+    engine = UnderwritingEngine(config=cfg, signal_cache=signal_cache)
+    results = engine.underwrite_incremental(
+        listings,
+        prior,
+        compute=lambda stale: underwrite_parallel(
+            UnderwritingEngine,
+            cfg,
+            stale,
+            _resolve_workers(workers),
+            engine_kwargs={"signal_cache": signal_cache},
+        ),
+    )
+    carried = sum(1 for r in results if r.carried_from_run)
 
     run_id = _run_id()
     storage = _get_storage()
     storage.save_deals(run_id, results)
+    scanned = signal_cache.save(storage)
     storage.close()
+    console.print(
+        f"[dim]Recomputed {len(results) - carried}, carried forward {carried} from earlier runs; "
+        f"description signals: {scanned} newly scanned, {cached_before} cached[/dim]"
+    )
 
     out_dir = _get_output_dir()
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -362,12 +720,24 @@ def run(
     source: Optional[str] = typer.Option(None, "--source", "-s", help="Override connector: realtor, redfin, or both"),
     limit: int = typer.Option(20, "--limit", "-n", help="Max deals to show in report"),
     sort: str = typer.Option("safety", "--sort", "-S", help="Sort by: safety, cashflow, coc, dscr"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Serve repeat API calls from the on-disk response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses, re-fetch and overwrite them"),
+    replay: Optional[Path] = typer.Option(None, "--replay", help="Replay raw API dumps (file or output/raw dir) instead of calling the API"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for underwriting (0 = all CPUs)"),
 ) -> None:
     """End-to-end: fetch, underwrite, and report."""
     cfg = load_config(config_path)
     console.print("[bold]Running full pipeline...[/bold]\n")
-    fetch(config_path=config_path, cities_only=cities_only, source=source)
-    run_id = underwrite(config_path=config_path, sort=sort)
+    fetch(
+        config_path=config_path,
+        limit=None,
+        cities_only=cities_only,
+        source=source,
+        cache=cache,
+        refresh=refresh,
+        replay=replay,
+    )
+    run_id = underwrite(config_path=config_path, sort=sort, workers=workers, full=False)
     console.print()
     if run_id:
         import json as _json
@@ -445,11 +815,12 @@ def _display_land_report(results: list, run_id: str, limit: int = 20) -> None:
 def land_underwrite(
     config_path: Optional[Path] = typer.Option(None, "--config", "-c"),
     sort: str = typer.Option("score", "--sort", "-S", help="score, roi, price, acreage"),
+    workers: int = typer.Option(1, "--workers", "-w", help="Worker processes for underwriting (0 = all CPUs)"),
 ) -> None:
     """Underwrite vacant land listings from the database."""
     cfg = load_config(config_path)
     storage = _get_storage()
-    all_listings = storage.load_listings()
+    all_listings = storage.load_listings(include_removed=False)
     storage.close()
     listings = [l for l in all_listings if is_land_candidate(l)]
     if not listings:
@@ -459,8 +830,7 @@ def land_underwrite(
         )
         raise typer.Exit(1)
     console.print(f"[dim]Underwriting {len(listings)} land listings (of {len(all_listings)} total)[/dim]")
-    engine = LandUnderwritingEngine(config=cfg)
-    results = engine.underwrite_many(listings)
+    results = underwrite_parallel(LandUnderwritingEngine, cfg, listings, _resolve_workers(workers))
     ranked = _sort_land_results(results, sort)
     run_id = _run_id()
     storage = _get_storage()
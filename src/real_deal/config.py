@@ -7,6 +7,7 @@ from typing import Any
 
 import yaml
 
+from .connectors.retry import RetryPolicy
 from .models import (
     PassFailThresholds,
     RentEstimationParams,
@@ -64,6 +65,50 @@ def get_export_min_cashflow_monthly(config: dict[str, Any]) -> float:
     return float(config.get("pass_fail", {}).get("min_cashflow_monthly", 150))
 
 
+def get_rate_limit(config: dict[str, Any], host: str) -> tuple[float, int]:
+    """(requests_per_second, burst) for a RapidAPI host from data_source.rate_limit.
+
+    Falls back to one request per ``delay_seconds`` when no rate limit is configured.
+    """
+    ds = config.get("data_source", {})
+    rl = ds.get("rate_limit", {})
+    if not isinstance(rl, dict) or not rl:
+        delay = float(ds.get("delay_seconds", 2.0))
+        return (1.0 / delay if delay > 0 else 0.0), 1
+    host_cfg = (rl.get("hosts") or {}).get(host, {})
+    merged = {**rl, **host_cfg} if isinstance(host_cfg, dict) else rl
+    return float(merged.get("requests_per_second", 0.5)), int(merged.get("burst", 1))
+
+
+def get_retry_policy(config: dict[str, Any]) -> RetryPolicy:
+    """Connector retry/backoff policy from data_source.retry."""
+    rt = config.get("data_source", {}).get("retry", {}) or {}
+    return RetryPolicy(
+        max_attempts=int(rt.get("max_attempts", 4)),
+        backoff_base=float(rt.get("backoff_base_seconds", 1.0)),
+        backoff_max=float(rt.get("backoff_max_seconds", 30.0)),
+        retry_after_max=float(rt.get("retry_after_max_seconds", 120.0)),
+    )
+
+
+def get_circuit_breaker_params(config: dict[str, Any]) -> tuple[int, float]:
+    """(failure_threshold, reset_timeout_seconds) from data_source.circuit_breaker."""
+    cb = config.get("data_source", {}).get("circuit_breaker", {}) or {}
+    return int(cb.get("failure_threshold", 5)), float(cb.get("reset_timeout_seconds", 60.0))
+
+
+def get_http_client_params(config: dict[str, Any]) -> dict[str, Any]:
+    """Keyword args for connectors.http.build_async_client from data_source.http."""
+    http = config.get("data_source", {}).get("http", {}) or {}
+    return {
+        "timeout": float(http.get("timeout_seconds", 60)),
+        "max_connections": int(http.get("max_connections", 20)),
+        "max_keepalive_connections": int(http.get("max_keepalive_connections", 10)),
+        "keepalive_expiry": float(http.get("keepalive_expiry_seconds", 30)),
+        "http2": bool(http.get("http2", True)),
+    }
+
+
 def get_pass_fail_thresholds(config: dict[str, Any]) -> PassFailThresholds:
     """Extract pass/fail thresholds from config."""
     pf = config.get("pass_fail", {})
@@ -194,10 +239,14 @@ def get_rent_estimation_params_for_city(
     city_to_tier: dict[str, str] | None = None,
 ) -> RentEstimationParams:
     """Get rent estimation params for a specific city (tiered by city tier)."""
+    return get_rent_estimation_params_for_tier(config, get_city_tier(config, city, city_to_tier))
+
+
+def get_rent_estimation_params_for_tier(config: dict[str, Any], tier: str | None) -> RentEstimationParams:
+    """Rent estimation params for a city tier (``None`` = default)."""
     bounds = _rent_global_bounds(config)
     rent_cfg = config.get("rent_estimation", {})
 
-    tier = get_city_tier(config, city, city_to_tier)
     tier_params = rent_cfg.get("tiers", {})
     default_params = rent_cfg.get("default", {})
 
@@ -217,8 +266,12 @@ def get_underwriting_assumptions_for_city(
     city_to_tier: dict[str, str] | None = None,
 ) -> UnderwritingAssumptions:
     """Underwriting assumptions with tier overrides for tax and insurance."""
+    return get_underwriting_assumptions_for_tier(config, get_city_tier(config, city, city_to_tier))
+
+
+def get_underwriting_assumptions_for_tier(config: dict[str, Any], tier: str | None) -> UnderwritingAssumptions:
+    """Underwriting assumptions for a city tier (``None`` = defaults only)."""
     base = get_underwriting_assumptions(config)
-    tier = get_city_tier(config, city, city_to_tier)
     tier_overrides = config.get("assumption_tiers", {})
     overrides = tier_overrides.get(tier, {}) if tier else {}
     if not isinstance(overrides, dict):
@@ -1,12 +1,14 @@
 """Source connectors for listing data."""
 
-from .base import ListingConnector, ConnectorResult
+from .base import ListingConnector, ConnectorResult, CityFetchStats, ListingPage
 from .rapidapi_realtor import RapidAPIRealtorConnector
 from .rapidapi_redfin import RapidAPIRedfinConnector
 
 __all__ = [
     "ListingConnector",
     "ConnectorResult",
+    "CityFetchStats",
+    "ListingPage",
     "RapidAPIRealtorConnector",
     "RapidAPIRedfinConnector",
 ]
@@ -2,14 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ..models import Listing
 
 
+@dataclass
+class CityFetchStats:
+    """Per-city request outcome for a fetch."""
+
+    city: str
+    status: str = "ok"  # ok | partial | http_error | error | circuit_open
+    requests: int = 0  # HTTP attempts sent (including retries)
+    retries: int = 0
+    cache_hits: int = 0
+    listings: int = 0
+    elapsed_seconds: float = 0.0  # time spent in HTTP calls
+    error: str | None = None
+    shared_with: str | None = None  # served by this city's request (same search region)
+
+    def add_counts(self, other: CityFetchStats) -> None:
+        """Fold another stats record's request counters into this one."""
+        self.requests += other.requests
+        self.retries += other.retries
+        self.cache_hits += other.cache_hits
+        self.elapsed_seconds += other.elapsed_seconds
+
+
 @dataclass
 class ConnectorResult:
     """Result of a connector fetch operation."""
@@ -18,6 +42,22 @@ class ConnectorResult:
     raw_payloads: list[dict]
     source: str
     errors: list[str]
+    city_stats: list[CityFetchStats] = field(default_factory=list)
+
+
+@dataclass
+class ListingPage:
+    """One normalised page of API results (see :meth:`ListingConnector.stream`)."""
+
+    city: str
+    page: int  # 1-based
+    listings: list[Listing]
+    raw_payloads: list[dict]
+    province: str = ""
+    response: Any = None  # decoded API response the page was normalised from
+
+
+PageCallback = Callable[[ListingPage], None]
 
 
 class ListingConnector(ABC):
@@ -39,6 +79,52 @@ class ListingConnector(ABC):
         """
         ...
 
+    async def fetch_async(
+        self,
+        cities: list[str],
+        max_price: float,
+        province: str = "ON",
+        on_page: PageCallback | None = None,
+    ) -> ConnectorResult:
+        """
+        Async variant of :meth:`fetch`; ``on_page`` is called with each page as it is normalised.
+        Default runs the blocking fetch in a worker thread (one page); HTTP connectors override it.
+        """
+        result = await asyncio.to_thread(self.fetch, cities, max_price, province)
+        if on_page is not None:
+            on_page(ListingPage(",".join(cities), 1, result.listings, result.raw_payloads))
+        return result
+
+    async def stream(
+        self,
+        cities: list[str],
+        max_price: float,
+        province: str = "ON",
+    ) -> AsyncIterator[ListingPage]:
+        """
+        Yield normalised pages as they land, so filtering/storage can start early.
+
+        Pages are not deduplicated across cities, tiles or sources; errors and
+        per-city stats are only reported by :meth:`fetch_async`. An exception in
+        the fetch is re-raised once the pages received so far have been yielded.
+        """
+        queue: asyncio.Queue[ListingPage | None] = asyncio.Queue()
+
+        async def run() -> ConnectorResult:
+            try:
+                return await self.fetch_async(cities, max_price, province, on_page=queue.put_nowait)
+            finally:
+                queue.put_nowait(None)
+
+        task = asyncio.create_task(run())
+        try:
+            while (page := await queue.get()) is not None:
+                yield page
+            await task
+        finally:
+            if not task.done():
+                task.cancel()
+
     @property
     @abstractmethod
     def source_name(self) -> str:
@@ -0,0 +1,124 @@
+"""On-disk cache of API responses (SQLite), keyed by request content."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+CACHE_MODES = ("use", "off", "refresh")
+
+
+class ResponseCache:
+    """
+    Content-addressed cache for successful (HTTP 200) JSON responses.
+
+    Keys hash host + endpoint + query params + JSON body (never the API key).
+    Entries expire per endpoint via ``ttl_seconds`` (checked on read, so TTL
+    changes apply to existing rows). Modes:
+
+    - ``use``: serve fresh hits, store misses
+    - ``refresh``: always hit the API, overwrite stored responses
+    - ``off``: bypass the cache entirely
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        ttl_seconds: dict[str, float] | None = None,
+        default_ttl: float = 3600.0,
+        mode: str = "use",
+    ) -> None:
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown cache mode {mode!r}; expected one of {CACHE_MODES}")
+        self.path = Path(path)
+        self.ttl_seconds = dict(ttl_seconds or {})
+        self.default_ttl = float(default_ttl)
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    endpoint TEXT,
+                    body TEXT,
+                    created_at REAL
+                )
+                """
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(
+        host: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+    ) -> str:
+        """Stable hash of the request content."""
+        blob = json.dumps(
+            [host, endpoint, params or {}, body], sort_keys=True, default=str
+        )
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> float:
+        return float(self.ttl_seconds.get(endpoint, self.default_ttl))
+
+    def get(
+        self,
+        host: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+    ) -> Any | None:
+        """Return cached JSON data, or None on miss / expiry / non-``use`` mode."""
+        if self.mode != "use":
+            return None
+        key = self.make_key(host, endpoint, params, body)
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_for(endpoint):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(
+        self,
+        host: str,
+        endpoint: str,
+        data: Any,
+        params: dict[str, Any] | None = None,
+        body: Any = None,
+    ) -> None:
+        """Store a successful response (no-op when mode is ``off``)."""
+        if self.mode == "off":
+            return
+        key = self.make_key(host, endpoint, params, body)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, endpoint, body, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, endpoint, json.dumps(data, default=str), time.time()),
+            )
+            conn.commit()
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,335 @@
+"""Local stand-in for the RapidAPI Realtor.ca and Redfin Canada hosts (benchmarks, offline tests).
+
+Serves ``/properties/search`` (Realtor), ``/properties/auto-complete`` and
+``/properties/search-sale`` (Redfin) from a deterministic synthetic market, or
+from items recorded by :class:`.replay.ResponseRecorder`, with configurable
+latency, 429 injection and page sizes. Point a connector at it with
+``base_url=server.base_url``.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from .city_coords import CITY_COORDS, get_city_coords
+from .replay import replay_files
+
+_STREETS = ["Main St", "King St", "Queen St", "Victoria Ave", "Elm St", "Park Rd", "Lakeshore Dr"]
+_DESCRIPTIONS = [
+    "Legal duplex with separate entrance and two kitchens. Upper unit rented at $1,500/month.",
+    "Well kept bungalow close to schools and shopping.",
+    "Income property: basement apartment with in-law suite, separate hydro meters.",
+    "Triplex in a quiet neighbourhood, all units tenanted.",
+    "Renovated family home, large lot, detached garage.",
+    "Vacant land / building lot, 0.5 acres, municipal services at the road.",
+]
+
+
+@dataclass
+class FakeAPIConfig:
+    """Behaviour knobs for :class:`FakeRapidAPIServer`."""
+
+    latency_seconds: float = 0.05
+    latency_jitter: float = 0.0  # extra uniform 0..jitter seconds per request
+    throttle_rate: float = 0.0  # fraction of requests answered with 429
+    retry_after: float = 1.0  # Retry-After seconds sent with injected 429s
+    realtor_page_size: int = 200  # max RecordsPerPage honoured
+    redfin_page_size: int = 350
+    listings_per_city: int = 120
+    seed: int = 42
+    recorded: Path | None = None  # serve items from responses_*.jsonl / listings_*.json dumps
+
+
+class FakeMarket:
+    """Deterministic listings per city (synthetic, or loaded from recorded dumps)."""
+
+    def __init__(self, config: FakeAPIConfig) -> None:
+        self.config = config
+        self._realtor: dict[str, list[dict]] = {}
+        self._redfin: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+        if config.recorded is not None:
+            self._load_recorded(config.recorded)
+
+    @staticmethod
+    def region_id(city: str) -> str:
+        return f"fake_{city.strip().lower().replace(' ', '-')}"
+
+    def city_for_region(self, region_id: str) -> str:
+        slug = region_id.removeprefix("fake_")
+        for city in [*CITY_COORDS, *self._redfin]:
+            if city.lower().replace(" ", "-") == slug:
+                return city
+        return slug.replace("-", " ").title()
+
+    def realtor_items(self, city: str) -> list[dict]:
+        with self._lock:
+            if city not in self._realtor and self.config.recorded is None:
+                self._realtor[city] = [self._realtor_item(h) for h in self._synthetic(city)]
+            return self._realtor.get(city, [])
+
+    def redfin_items(self, city: str) -> list[dict]:
+        with self._lock:
+            if city not in self._redfin and self.config.recorded is None:
+                self._redfin[city] = [self._redfin_item(h) for h in self._synthetic(city)]
+            return self._redfin.get(city, [])
+
+    def _synthetic(self, city: str) -> list[dict[str, Any]]:
+        rng = random.Random(f"{self.config.seed}:{city}")
+        lat0, lng0 = get_city_coords(city)
+        homes = []
+        for i in range(self.config.listings_per_city):
+            homes.append(
+                {
+                    "id": f"{self.region_id(city)}-{i}",
+                    "city": city,
+                    "lat": lat0 + rng.uniform(-0.12, 0.12),
+                    "lng": lng0 + rng.uniform(-0.12, 0.12),
+                    "price": round(rng.uniform(150_000, 650_000), -3),
+                    "address": f"{rng.randint(1, 999)} {rng.choice(_STREETS)}",
+                    "beds": rng.randint(1, 6),
+                    "baths": rng.choice([1, 1.5, 2, 2.5, 3]),
+                    "description": rng.choice(_DESCRIPTIONS),
+                }
+            )
+        return homes
+
+    @staticmethod
+    def _realtor_item(h: dict[str, Any]) -> dict:
+        return {
+            "MlsNumber": h["id"],
+            "Price": f"${h['price']:,.0f}",
+            "Address": f"{h['address']}|{h['city']}, Ontario",
+            "Province": "ON",
+            "Bedrooms": h["beds"],
+            "Bathrooms": h["baths"],
+            "PropertyType": "Single Family",
+            "Description": h["description"],
+            "RelativeURL": f"/real-estate/{h['id']}",
+            "Latitude": h["lat"],
+            "Longitude": h["lng"],
+        }
+
+    @staticmethod
+    def _redfin_item(h: dict[str, Any]) -> dict:
+        return {
+            "homeData": {
+                "mlsId": h["id"],
+                "priceInfo": {"amount": h["price"]},
+                "addressInfo": {
+                    "formattedStreetLine": h["address"],
+                    "city": h["city"],
+                    "state": "ON",
+                    "centroid": {"centroid": {"latitude": h["lat"], "longitude": h["lng"]}},
+                },
+                "propertyType": 6,
+                "beds": h["beds"],
+                "bathInfo": {"computedTotalBaths": h["baths"]},
+                "publicRemarks": h["description"],
+                "url": f"/ON/{h['city'].replace(' ', '-')}/home/{h['id']}",
+            }
+        }
+
+    def _load_recorded(self, path: Path) -> None:
+        """Pool recorded raw items per source and city."""
+        realtor: dict[str, list[dict]] = defaultdict(list)
+        redfin: dict[str, list[dict]] = defaultdict(list)
+        for file in replay_files(path):
+            with open(file, encoding="utf-8") as f:
+                if file.suffix == ".jsonl":
+                    records = [json.loads(line) for line in f if line.strip()]
+                else:
+                    records = [{"city": "", "response": json.load(f)}]
+            for rec in records:
+                resp = rec.get("response")
+                items = resp if isinstance(resp, list) else []
+                if isinstance(resp, dict):
+                    items = resp.get("Results") or resp.get("data") or []
+                for item in items if isinstance(items, list) else []:
+                    if not isinstance(item, dict):
+                        continue
+                    if "homeData" in item:
+                        city = ((item["homeData"] or {}).get("addressInfo") or {}).get("city") or rec.get("city")
+                        redfin[str(city)].append(item)
+                    else:
+                        addr = str(item.get("Address") or "").split("|")
+                        city = addr[1].split(",")[0].strip() if len(addr) > 1 else rec.get("city")
+                        realtor[str(city)].append(item)
+        self._realtor, self._redfin = dict(realtor), dict(redfin)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _FakeHTTPServer
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - keep benchmarks quiet
+        pass
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def _handle(self, method: str) -> None:
+        fake = self.server.fake
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"null") if length else None
+
+        if url.path == "/__stats":
+            return self._send(200, fake.stats())
+        fake.count(url.path)
+        cfg = fake.config
+        delay = cfg.latency_seconds + (fake.rng_uniform(0, cfg.latency_jitter) if cfg.latency_jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+        if cfg.throttle_rate and fake.rng_uniform(0, 1) < cfg.throttle_rate:
+            fake.count("429")
+            return self._send(429, {"message": "Too many requests"}, {"Retry-After": f"{cfg.retry_after:g}"})
+
+        if method == "POST" and url.path == "/properties/search":
+            return self._send(200, fake.realtor_search((body or {}).get("SearchQuery") or {}))
+        if method == "GET" and url.path == "/properties/auto-complete":
+            return self._send(200, fake.auto_complete(query.get("query", "")))
+        if method == "GET" and url.path == "/properties/search-sale":
+            return self._send(200, fake.search_sale(query.get("regionId", ""), int(query.get("page") or 1)))
+        return self._send(404, {"message": f"Unknown endpoint {method} {url.path}"})
+
+    def _send(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class _FakeHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    fake: FakeRapidAPIServer
+
+
+class FakeRapidAPIServer:
+    """
+    Threaded local server speaking the subset of both RapidAPI hosts the connectors use.
+
+    Use as a context manager (or ``start()``/``stop()``); ``base_url`` is what to
+    pass as the connectors' ``base_url``. ``stats()`` (also ``GET /__stats``)
+    returns request counts per endpoint plus injected 429s.
+    """
+
+    def __init__(self, config: FakeAPIConfig | None = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.config = config or FakeAPIConfig()
+        self.market = FakeMarket(self.config)
+        self._rng = random.Random(self.config.seed)
+        self._counts: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._httpd = _FakeHTTPServer((host, port), _Handler)
+        self._httpd.fake = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakeRapidAPIServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> FakeRapidAPIServer:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def rng_uniform(self, a: float, b: float) -> float:
+        with self._lock:
+            return self._rng.uniform(a, b)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+    # --- endpoint payloads -------------------------------------------------
+
+    def realtor_search(self, q: dict[str, Any]) -> dict[str, Any]:
+        """Items inside the query box and price band, paged by CurrentPage/RecordsPerPage."""
+        try:
+            lat_min, lat_max = float(q["LatitudeMin"]), float(q["LatitudeMax"])
+            lng_min, lng_max = float(q["LongitudeMin"]), float(q["LongitudeMax"])
+        except (KeyError, TypeError, ValueError):
+            return {"Paging": {"TotalRecords": 0, "TotalPages": 0}, "Results": []}
+        price_min = float(q.get("PriceMin") or 0)
+        price_max = float(q.get("PriceMax") or math.inf)
+
+        matches: list[dict] = []
+        for city, (lat, lng) in CITY_COORDS.items():
+            if not (lat_min - 0.15 <= lat <= lat_max + 0.15 and lng_min - 0.15 <= lng <= lng_max + 0.15):
+                continue
+            for item in self.market.realtor_items(city):
+                if (
+                    lat_min <= float(item.get("Latitude", lat)) <= lat_max
+                    and lng_min <= float(item.get("Longitude", lng)) <= lng_max
+                    and price_min <= _price(item.get("Price")) <= price_max
+                ):
+                    matches.append(item)
+
+        per_page = max(1, min(int(q.get("RecordsPerPage") or self.config.realtor_page_size), self.config.realtor_page_size))
+        page = max(1, int(q.get("CurrentPage") or 1))
+        start = (page - 1) * per_page
+        return {
+            "Paging": {
+                "RecordsPerPage": per_page,
+                "CurrentPage": page,
+                "TotalRecords": len(matches),
+                "TotalPages": math.ceil(len(matches) / per_page),
+            },
+            "Results": matches[start : start + per_page],
+        }
+
+    def auto_complete(self, query: str) -> dict[str, Any]:
+        city = query.split(",")[0].strip()
+        if not city:
+            return {"data": []}
+        return {"data": [{"rows": [{"id": self.market.region_id(city), "type": "2", "name": city, "subName": "ON, Canada"}]}]}
+
+    def search_sale(self, region_id: str, page: int) -> dict[str, Any]:
+        items = self.market.redfin_items(self.market.city_for_region(region_id))
+        size = self.config.redfin_page_size
+        start = (max(1, page) - 1) * size
+        return {"data": items[start : start + size]}
+
+
+def _price(value: Any) -> float:
+    try:
+        return float(str(value).replace("$", "").replace(",", ""))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,254 @@
+"""Async HTTP helpers shared by the RapidAPI connectors."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from .base import CityFetchStats, ConnectorResult
+from .cache import ResponseCache
+from .rate_limit import TokenBucket
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy, parse_retry_after
+
+
+def http2_available() -> bool:
+    """True when the optional ``h2`` package is installed (httpx needs it for HTTP/2)."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def build_async_client(
+    timeout: float = 60.0,
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """
+    Pooled keep-alive client meant to live for a whole fetch run.
+
+    HTTP/2 is used when requested and ``h2`` is installed; otherwise the client
+    falls back to HTTP/1.1 keep-alive with the same pool limits.
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2 and http2_available(),
+    )
+
+
+@asynccontextmanager
+async def client_scope(client: httpx.AsyncClient | None) -> AsyncIterator[httpx.AsyncClient]:
+    """Yield *client* untouched (its owner closes it), or a private client closed on exit."""
+    if client is not None:
+        yield client
+        return
+    async with build_async_client() as own:
+        yield own
+
+
+class HostThrottle:
+    """
+    Concurrency caps (global and per host) plus per-host rate limiting for async fetches.
+
+    Each host's :class:`TokenBucket` is acquired before the request is sent, so
+    pacing follows the API quota while requests overlap their network latency.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 4,
+        limiters: dict[str, TokenBucket] | None = None,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.per_host_concurrency = max(1, int(per_host_concurrency))
+        self.limiters = dict(limiters or {})
+        self._global = asyncio.Semaphore(self.max_concurrency)
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._hosts.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_concurrency)
+            self._hosts[host] = sem
+        return sem
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        """Hold a global + per-host slot and a rate-limit token for one request to *host*."""
+        async with self._global, self._host_semaphore(host):
+            limiter = self.limiters.get(host)
+            if limiter is not None:
+                await limiter.acquire()
+            yield
+
+
+@dataclass
+class FetchContext:
+    """Everything one fetch needs to send requests: client, throttle, cache, retry, breakers."""
+
+    client: httpx.AsyncClient
+    throttle: HostThrottle
+    cache: ResponseCache | None = None
+    retry: RetryPolicy = field(default_factory=RetryPolicy)
+    breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
+
+
+async def request_json(
+    ctx: FetchContext,
+    method: str,
+    host: str,
+    base_url: str,
+    endpoint: str,
+    *,
+    headers: dict[str, str] | None = None,
+    params: dict[str, Any] | None = None,
+    json_body: Any = None,
+    timeout: float | None = None,
+    stats: CityFetchStats | None = None,
+) -> tuple[int, Any]:
+    """
+    Send one API request and return ``(status_code, json_data)``.
+
+    Cache hits skip the throttle (no quota spent). Retryable statuses (429/5xx)
+    and transport errors are retried with backoff, honouring ``Retry-After``.
+    Only HTTP 200 responses are parsed and cached; other statuses return
+    ``(status, None)``. Raises :class:`CircuitOpenError` when the host's breaker is open.
+    """
+    if ctx.cache is not None:
+        cached = ctx.cache.get(host, endpoint, params, json_body)
+        if cached is not None:
+            if stats is not None:
+                stats.cache_hits += 1
+            return 200, cached
+
+    breaker = ctx.breakers.get(host)
+    kwargs: dict[str, Any] = {}
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+
+    attempt = 0
+    while True:
+        attempt += 1
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(host)
+        if stats is not None:
+            stats.requests += 1
+            if attempt > 1:
+                stats.retries += 1
+
+        started = time.monotonic()
+        try:
+            async with ctx.throttle.slot(host):
+                resp = await ctx.client.request(
+                    method,
+                    f"{base_url}{endpoint}",
+                    params=params,
+                    json=json_body,
+                    headers=headers,
+                    **kwargs,
+                )
+        except httpx.TransportError:
+            if breaker is not None:
+                breaker.record_failure()
+            wait = ctx.retry.delay(attempt)
+            if wait is None:
+                raise
+            await asyncio.sleep(wait)
+            continue
+        finally:
+            if stats is not None:
+                stats.elapsed_seconds += time.monotonic() - started
+
+        status = resp.status_code
+        if status == 200:
+            if breaker is not None:
+                breaker.record_success()
+            break
+        if not ctx.retry.should_retry(status):
+            # Client errors (4xx other than 429) say nothing about host health,
+            # but a half-open probe must still be released or the breaker stays blocked
+            if breaker is not None:
+                breaker.release()
+            return status, None
+        if breaker is not None:
+            breaker.record_failure()
+        wait = ctx.retry.delay(attempt, parse_retry_after(resp.headers.get("Retry-After")))
+        if wait is None:
+            return status, None
+        await asyncio.sleep(wait)
+
+    data = resp.json()
+    if ctx.cache is not None:
+        ctx.cache.put(host, endpoint, data, params, json_body)
+    return 200, data
+
+
+async def paginate(
+    fetch_page: Callable[[int], Awaitable[tuple[int, Any]]],
+    count_items: Callable[[Any], int],
+    page_size: int,
+    max_pages: int,
+    total_pages: Callable[[Any], int | None] | None = None,
+) -> AsyncIterator[tuple[int, int, Any]]:
+    """
+    Yield ``(page, status, data)`` for pages 1, 2, ... of a paginated endpoint.
+
+    Stops after a non-200 response, ``max_pages``, the last page the API reports
+    (``total_pages``), or — when the API reports none — a page shorter than
+    ``page_size``. Callers may stop early (e.g. when the API ignores the page param).
+    """
+    page = 1
+    while True:
+        status, data = await fetch_page(page)
+        yield page, status, data
+        if status != 200 or page >= max_pages:
+            return
+        total = total_pages(data) if total_pages is not None else None
+        if total is not None:
+            if page >= total:
+                return
+        elif count_items(data) < page_size:
+            return
+        page += 1
+
+
+async def fetch_cities(
+    cities: list[str],
+    fetch_city: Callable[[str, CityFetchStats], Awaitable[ConnectorResult]],
+) -> list[tuple[ConnectorResult | None, CityFetchStats]]:
+    """
+    Run ``fetch_city(city, stats)`` for every city concurrently, in city order.
+
+    A city that raises yields ``(None, stats)`` with the failure recorded on its
+    stats, so one bad city (or an open circuit) never sinks the whole fetch.
+    """
+    stats = [CityFetchStats(city=city) for city in cities]
+    outcomes = await asyncio.gather(
+        *(fetch_city(city, st) for city, st in zip(cities, stats)),
+        return_exceptions=True,
+    )
+    results: list[tuple[ConnectorResult | None, CityFetchStats]] = []
+    for st, outcome in zip(stats, outcomes):
+        if isinstance(outcome, BaseException):
+            st.status = "circuit_open" if isinstance(outcome, CircuitOpenError) else "error"
+            st.error = str(outcome) or type(outcome).__name__
+            results.append((None, st))
+        else:
+            st.listings = len(outcome.listings)
+            results.append((outcome, st))
+    return results
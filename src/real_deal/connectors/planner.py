@@ -0,0 +1,78 @@
+"""Fetch planning: collapse cities that would send the same request, fan results back out."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .base import CityFetchStats, ConnectorResult
+
+if TYPE_CHECKING:
+    from ..models import Listing
+
+
+@dataclass
+class PlannedFetch:
+    """One API request standing in for one or more cities (the first city is the label)."""
+
+    region: Any  # what is queried: a BoundingBox, a Redfin regionId, ...
+    cities: list[str]
+
+    @property
+    def label(self) -> str:
+        return self.cities[0]
+
+
+def plan_fetches(cities: list[str], region_of: Callable[[str], Hashable]) -> list[PlannedFetch]:
+    """Collapse cities whose region is identical into one request (first-seen order)."""
+    plan: dict[Hashable, PlannedFetch] = {}
+    for city in cities:
+        region = region_of(city)
+        planned = plan.get(region)
+        if planned is None:
+            plan[region] = PlannedFetch(region, [city])
+        elif city not in planned.cities:
+            planned.cities.append(city)
+    return list(plan.values())
+
+
+def _listings_per_city(cities: list[str], listings: list[Listing]) -> dict[str, int]:
+    """Count listings by the city they name; unmatched ones go to the first city."""
+    counts = dict.fromkeys(cities, 0)
+    by_lower = {city.lower(): city for city in cities}
+    for listing in listings:
+        counts[by_lower.get((listing.city or "").lower(), cities[0])] += 1
+    return counts
+
+
+def fan_out_stats(
+    plan: list[PlannedFetch],
+    outcomes: list[tuple[ConnectorResult | None, CityFetchStats]],
+) -> list[CityFetchStats]:
+    """
+    Per-city stats from per-request outcomes (as returned by ``http.fetch_cities``).
+
+    The label city keeps the request counters; every other city in the request
+    gets its own entry with the same status, ``shared_with`` set to the label,
+    and the listings that name it, so totals are not double-counted.
+    """
+    city_stats: list[CityFetchStats] = []
+    for planned, (outcome, stats) in zip(plan, outcomes):
+        stats.city = planned.label
+        city_stats.append(stats)
+        if len(planned.cities) == 1:
+            continue
+        counts = _listings_per_city(planned.cities, outcome.listings if outcome else [])
+        stats.listings = counts[planned.label]
+        for city in planned.cities[1:]:
+            city_stats.append(
+                CityFetchStats(
+                    city=city,
+                    status=stats.status,
+                    listings=counts[city],
+                    error=stats.error,
+                    shared_with=planned.label,
+                )
+            )
+    return city_stats
@@ -6,17 +6,26 @@ Endpoints: /parseUrl, /properties/search, /properties/details
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
-import time
+from collections.abc import Awaitable
+from contextlib import aclosing
 from typing import Any
 
 import httpx
 
 from ..listing_classification import is_land_listing
+from ..listing_utils import promoted_payload_fields
 from ..models import Listing
-from .base import ConnectorResult, ListingConnector
+from .base import CityFetchStats, ConnectorResult, ListingConnector, ListingPage, PageCallback
+from .cache import ResponseCache
 from .city_coords import get_city_coords
+from .http import FetchContext, HostThrottle, client_scope, fetch_cities, paginate, request_json
+from .planner import PlannedFetch, fan_out_stats
+from .rate_limit import TokenBucket
+from .retry import CircuitBreaker, RetryPolicy
+from .tiling import BoundingBox, merge_city_boxes
 
 
 class RapidAPIRealtorConnector(ListingConnector):
@@ -24,7 +33,10 @@ class RapidAPIRealtorConnector(ListingConnector):
     Connector for RapidAPI Realtor.ca Scraper API (baqo271).
     https://rapidapi.com/baqo271/api/realtor-ca-scraper-api
 
-    Uses /properties/search with searchQuery for listings.
+    Uses /properties/search with searchQuery for listings, following
+    CurrentPage/RecordsPerPage paging. Overlapping city boxes are merged into
+    one query, and a box with more matches than paging could return is split
+    into quadrants (see :mod:`.tiling`).
     """
 
     def __init__(
@@ -36,15 +48,47 @@ class RapidAPIRealtorConnector(ListingConnector):
         property_type_group_id: str = "1",
         bounding_box_delta: float = 0.15,
         zoom_level: str = "10",
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 4,
+        rate_limiter: TokenBucket | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        client: httpx.AsyncClient | None = None,
+        base_url: str | None = None,
+        page_size: int = 200,
+        max_pages: int = 10,
+        tile_max_depth: int = 2,
+        tile_merge_overlap: float = 0.5,
     ) -> None:
         self.api_key = api_key or os.environ.get("RAPIDAPI_KEY", "")
         self.host = host
-        self.base_url = f"https://{host}"
+        # Override to target a stand-in (e.g. fake_api.FakeRapidAPIServer); host still keys limits
+        self.base_url = (base_url or f"https://{host}").rstrip("/")
         self.delay_seconds = delay_seconds
         self.min_price = min_price
         self.property_type_group_id = property_type_group_id
         self.bounding_box_delta = bounding_box_delta
         self.zoom_level = zoom_level
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        # Pass a shared bucket (see rate_limit.get_host_limiter) to pace across instances
+        self.rate_limiter = rate_limiter or TokenBucket(
+            1.0 / delay_seconds if delay_seconds > 0 else 0.0
+        )
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Pass a shared breaker (see retry.get_circuit_breaker) to trip across instances
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # Run-owned pooled client (see http.build_async_client); None = one client per fetch
+        self.client = client
+        # RecordsPerPage and the per-box page limit
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # A box with more matches than its pages returned (Paging.TotalRecords, or
+        # max_pages full pages) is split into quadrants, at most tile_max_depth times
+        self.tile_max_depth = tile_max_depth
+        self.tile_merge_overlap = tile_merge_overlap
 
     @property
     def source_name(self) -> str:
@@ -57,6 +101,16 @@ class RapidAPIRealtorConnector(ListingConnector):
         province: str = "ON",
     ) -> ConnectorResult:
         """Fetch listings from RapidAPI Realtor.ca Scraper."""
+        return asyncio.run(self.fetch_async(cities, max_price, province))
+
+    async def fetch_async(
+        self,
+        cities: list[str],
+        max_price: float,
+        province: str = "ON",
+        on_page: PageCallback | None = None,
+    ) -> ConnectorResult:
+        """Fetch all cities concurrently; results are merged in city order."""
         if not self.api_key:
             return ConnectorResult(
                 listings=[],
@@ -68,84 +122,230 @@ class RapidAPIRealtorConnector(ListingConnector):
         all_listings: list[Listing] = []
         all_raw: list[dict] = []
         errors: list[str] = []
+        seen_ids: set[str] = set()
 
-        with httpx.Client(timeout=60) as client:
-            for i, city in enumerate(cities):
-                if i > 0:
-                    time.sleep(self.delay_seconds)
-                try:
-                    result = self._fetch_city(city, max_price, province, client)
-                    all_listings.extend(result.listings)
-                    all_raw.extend(result.raw_payloads)
-                    errors.extend(result.errors)
-                except Exception as e:
-                    errors.append(f"{city}: {e!s}")
+        plan = self._plan_tiles(cities)
+        tiles = {tile.label: tile for tile in plan}
+        async with client_scope(self.client) as client:
+            ctx = self._fetch_context(client)
+            outcomes = await fetch_cities(
+                list(tiles),
+                lambda label, stats: self._fetch_tile(
+                    tiles[label], max_price, province, ctx, stats, on_page
+                ),
+            )
+
+        for outcome, stats in outcomes:
+            if outcome is None:
+                errors.append(f"{stats.city}: {stats.error}")
+                continue
+            # Neighbouring tiles and quadrant edges can return the same listing
+            for listing in outcome.listings:
+                if listing.id not in seen_ids:
+                    seen_ids.add(listing.id)
+                    all_listings.append(listing)
+            all_raw.extend(outcome.raw_payloads)
+            errors.extend(outcome.errors)
 
         return ConnectorResult(
             listings=all_listings,
             raw_payloads=all_raw,
             source=self.source_name,
             errors=errors,
+            city_stats=fan_out_stats(plan, outcomes),
+        )
+
+    def _plan_tiles(self, cities: list[str]) -> list[PlannedFetch]:
+        """One box per city; identical, contained and heavily overlapping boxes share a request."""
+        boxes = {
+            city: BoundingBox.around(*get_city_coords(city), self.bounding_box_delta)
+            for city in cities
+        }
+        return merge_city_boxes(boxes, self.tile_merge_overlap)
+
+    def _fetch_context(self, client: httpx.AsyncClient) -> FetchContext:
+        return FetchContext(
+            client=client,
+            throttle=HostThrottle(
+                max_concurrency=self.max_concurrency,
+                per_host_concurrency=self.per_host_concurrency,
+                limiters={self.host: self.rate_limiter},
+            ),
+            cache=self.cache,
+            retry=self.retry_policy,
+            breakers={self.host: self.circuit_breaker},
         )
 
-    def _build_search_query(self, city: str, max_price: float, province: str) -> dict[str, Any]:
-        """Build searchQuery for /properties/search endpoint."""
-        lat, lng = get_city_coords(city)
-        delta = self.bounding_box_delta
+    def _build_search_query(
+        self, box: BoundingBox, max_price: float, depth: int = 0, page: int = 1
+    ) -> dict[str, Any]:
+        """Build searchQuery for /properties/search endpoint (zoom in one level per split)."""
+        lat, lng = box.center
+        try:
+            zoom = str(int(self.zoom_level) + depth)
+        except ValueError:
+            zoom = self.zoom_level
         query: dict[str, Any] = {
-            "ZoomLevel": self.zoom_level,
+            "ZoomLevel": zoom,
             "Center": f"{lat},{lng}",
-            "LatitudeMax": str(lat + delta),
-            "LongitudeMax": str(lng + delta),
-            "LatitudeMin": str(lat - delta),
-            "LongitudeMin": str(lng - delta),
+            "LatitudeMax": str(box.lat_max),
+            "LongitudeMax": str(box.lng_max),
+            "LatitudeMin": str(box.lat_min),
+            "LongitudeMin": str(box.lng_min),
             "Sort": "6-D",
             "Currency": "CAD",
             "PriceMin": str(int(self.min_price)),
             "PriceMax": str(int(max_price)),
+            "CurrentPage": str(page),
+            "RecordsPerPage": str(self.page_size),
         }
         if self.property_type_group_id:
             query["PropertyTypeGroupID"] = self.property_type_group_id
         return query
 
-    def _fetch_city(
+    @staticmethod
+    def _paging(data: Any, key: str) -> int | None:
+        """Integer field from the response's Paging block, if present."""
+        paging = data.get("Paging") if isinstance(data, dict) else None
+        if not isinstance(paging, dict):
+            return None
+        try:
+            return int(paging[key])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _looks_truncated(self, data: Any, collected: int, pages: int, last_count: int) -> bool:
+        """True if the API reports more matches than paging returned, or paging hit max_pages."""
+        total = self._paging(data, "TotalRecords")
+        if total is not None:
+            return total > collected
+        return pages >= self.max_pages and last_count >= self.page_size
+
+    async def _fetch_tile(
         self,
-        city: str,
+        tile: PlannedFetch,
         max_price: float,
         province: str,
-        client: httpx.Client,
+        ctx: FetchContext,
+        stats: CityFetchStats,
+        on_page: PageCallback | None = None,
     ) -> ConnectorResult:
-        """Fetch listings for a single city via /properties/search."""
-        search_query = self._build_search_query(city, max_price, province)
+        """Fetch listings for one tile (one or more merged cities) via /properties/search."""
+        listings, raw_list, errors = await self._fetch_box(
+            tile.region, tile.label, max_price, province or "ON", ctx, stats, 0, on_page
+        )
+        if errors:
+            # Any failed page/quadrant or leftover truncation leaves the tile incomplete
+            stats.status = "partial" if raw_list else "http_error"
+            stats.error = errors[0].split(": ", 1)[-1]
+        return ConnectorResult(
+            listings=listings,
+            raw_payloads=raw_list,
+            source=self.source_name,
+            errors=errors,
+        )
+
+    async def _fetch_box(
+        self,
+        box: BoundingBox,
+        default_city: str,
+        max_price: float,
+        province: str,
+        ctx: FetchContext,
+        stats: CityFetchStats,
+        depth: int,
+        on_page: PageCallback | None = None,
+    ) -> tuple[list[Listing], list[dict], list[str]]:
+        """Query every page of *box*; if matches are still missing, also query its quadrants."""
         headers = {
             "Content-Type": "application/json",
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": self.host,
         }
-        payload = {"SearchQuery": search_query}
 
-        resp = client.post(
-            f"{self.base_url}/properties/search",
-            json=payload,
-            headers=headers,
-        )
+        def fetch_page(page: int) -> Awaitable[tuple[int, Any]]:
+            payload = {"SearchQuery": self._build_search_query(box, max_price, depth, page)}
+            return request_json(
+                ctx,
+                "POST",
+                self.host,
+                self.base_url,
+                "/properties/search",
+                headers=headers,
+                json_body=payload,
+                stats=stats,
+            )
 
-        if resp.status_code != 200:
-            return ConnectorResult(
-                listings=[],
-                raw_payloads=[],
-                source=self.source_name,
-                errors=[f"{city}: HTTP {resp.status_code}"],
+        listings: list[Listing] = []
+        raw_list: list[dict] = []
+        errors: list[str] = []
+        seen: set[str] = set()
+        data: Any = None
+        last_raw: list[dict] = []
+        pages = 0
+        async with aclosing(
+            paginate(
+                fetch_page,
+                lambda d: len(self._response_items(d)),
+                self.page_size,
+                self.max_pages,
+                lambda d: self._paging(d, "TotalPages"),
             )
+        ) as page_iter:
+            async for page, status, page_data in page_iter:
+                if status != 200:
+                    if page == 1:
+                        return [], [], [f"{default_city}: HTTP {status}"]
+                    errors.append(f"{default_city}: HTTP {status} on page {page}")
+                    break
+                page_listings, page_raw = self._normalize_response(page_data, default_city, province)
+                if page > 1 and page_raw == last_raw:
+                    break  # API ignored the page parameter
+                data, last_raw, pages = page_data, page_raw, page
+                for listing in page_listings:
+                    if listing.id not in seen:
+                        seen.add(listing.id)
+                        listings.append(listing)
+                raw_list.extend(page_raw)
+                if on_page is not None:
+                    on_page(
+                        ListingPage(default_city, page, page_listings, page_raw, province, page_data)
+                    )
 
-        data = resp.json()
-        listings, raw_list = self._normalize_response(data, city, province or "ON")
-        return ConnectorResult(
-            listings=listings,
-            raw_payloads=raw_list,
-            source=self.source_name,
-            errors=[],
-        )
+        truncated = self._looks_truncated(data, len(raw_list), pages, len(last_raw))
+        if truncated and depth >= self.tile_max_depth:
+            errors.append(f"{default_city}: still truncated at tile_max_depth {depth}")
+        elif truncated:
+            parts = await asyncio.gather(
+                *(
+                    self._fetch_box(
+                        quad, default_city, max_price, province, ctx, stats, depth + 1, on_page
+                    )
+                    for quad in box.quadrants()
+                ),
+                return_exceptions=True,
+            )
+            for part in parts:
+                if isinstance(part, BaseException):
+                    # One failed quadrant (e.g. circuit open) keeps the others' listings; the tile is partial
+                    errors.append(f"{default_city}: quadrant failed: {part or type(part).__name__}")
+                    continue
+                sub_listings, sub_raw, sub_errors = part
+                for listing in sub_listings:
+                    if listing.id not in seen:
+                        seen.add(listing.id)
+                        listings.append(listing)
+                raw_list.extend(sub_raw)
+                errors.extend(sub_errors)
+        return listings, raw_list, errors
+
+    @staticmethod
+    def _response_items(data: Any) -> list:
+        """Listing items from a response (bare array or Results/data wrapper)."""
+        items = data if isinstance(data, list) else []
+        if isinstance(data, dict):
+            items = data.get("Results") or data.get("Result") or data.get("data") or data.get("listings") or []
+        return items if isinstance(items, list) else []
 
     def _normalize_response(
         self, data: Any, city: str, expected_province: str = "ON"
@@ -154,14 +354,7 @@ class RapidAPIRealtorConnector(ListingConnector):
         listings: list[Listing] = []
         raw_list: list[dict] = []
 
-        items = data if isinstance(data, list) else []
-        if isinstance(data, dict):
-            items = data.get("Results") or data.get("Result") or data.get("data") or data.get("listings") or []
-
-        if not isinstance(items, list):
-            items = []
-
-        for item in items:
+        for item in self._response_items(data):
             if not isinstance(item, dict):
                 continue
             raw_list.append(item)
@@ -266,4 +459,5 @@ class RapidAPIRealtorConnector(ListingConnector):
             description=desc,
             url=url,
             raw_payload=item,
+            **promoted_payload_fields(item),
         )
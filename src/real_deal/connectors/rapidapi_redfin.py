@@ -6,16 +6,24 @@ Endpoints: properties/auto-complete (get regionId), properties/search-sale (list
 
 from __future__ import annotations
 
+import asyncio
 import os
 import re
-import time
+from collections.abc import Awaitable
+from contextlib import aclosing
 from typing import Any
 
 import httpx
 
 from ..listing_classification import is_land_listing
+from ..listing_utils import promoted_payload_fields
 from ..models import Listing
-from .base import ConnectorResult, ListingConnector
+from .base import CityFetchStats, ConnectorResult, ListingConnector, ListingPage, PageCallback
+from .cache import ResponseCache
+from .http import FetchContext, HostThrottle, client_scope, fetch_cities, paginate, request_json
+from .planner import fan_out_stats, plan_fetches
+from .rate_limit import TokenBucket
+from .retry import CircuitBreaker, CircuitOpenError, RetryPolicy
 
 
 # Redfin Canada API propertyType (Apidojo) — 8 is vacant land/lots, not townhouse
@@ -30,12 +38,20 @@ PROPERTY_TYPE_MAP = {
 }
 
 
+def region_key(city: str, province: str) -> tuple[str, str]:
+    """Normalized (city, province) key for regionId lookups."""
+    return (city or "").strip().lower(), (province or "").strip().upper()
+
+
 class RapidAPIRedfinConnector(ListingConnector):
     """
     Connector for RapidAPI Redfin Canada API (Apidojo).
     https://rapidapi.com/apidojo/api/redfin-canada
 
-    Uses auto-complete to get regionId by city, then search-sale for listings.
+    Uses auto-complete to get regionId by city, then search-sale for listings
+    (following its ``page`` param until a short page).
+    Known regionIds (``region_ids``) skip auto-complete, so steady-state scans
+    make one request per city; cities resolving to the same regionId share one.
     """
 
     def __init__(
@@ -44,12 +60,45 @@ class RapidAPIRedfinConnector(ListingConnector):
         host: str = "redfin-canada.p.rapidapi.com",
         delay_seconds: float = 2.0,
         min_price: float = 20000,
+        max_concurrency: int = 8,
+        per_host_concurrency: int = 4,
+        rate_limiter: TokenBucket | None = None,
+        cache: ResponseCache | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        region_ids: dict[tuple[str, str], str] | None = None,
+        client: httpx.AsyncClient | None = None,
+        base_url: str | None = None,
+        page_size: int = 350,
+        max_pages: int = 10,
     ) -> None:
         self.api_key = api_key or os.environ.get("RAPIDAPI_KEY", "")
         self.host = host
-        self.base_url = f"https://{host}"
+        # Override to target a stand-in (e.g. fake_api.FakeRapidAPIServer); host still keys limits
+        self.base_url = (base_url or f"https://{host}").rstrip("/")
         self.delay_seconds = delay_seconds
         self.min_price = min_price
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        # Pass a shared bucket (see rate_limit.get_host_limiter) to pace across instances
+        self.rate_limiter = rate_limiter or TokenBucket(
+            1.0 / delay_seconds if delay_seconds > 0 else 0.0
+        )
+        self.cache = cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        # Pass a shared breaker (see retry.get_circuit_breaker) to trip across instances
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # Run-owned pooled client (see http.build_async_client); None = one client per fetch
+        self.client = client
+        # search-sale results per page (a shorter page is the last) and page limit per region
+        self.page_size = page_size
+        self.max_pages = max_pages
+        # (city, province) -> regionId; preload from Storage.load_region_ids()
+        self.region_ids: dict[tuple[str, str], str] = {
+            region_key(c, p): rid for (c, p), rid in (region_ids or {}).items()
+        }
+        # Resolved via auto-complete during this instance's fetches (persist these)
+        self.new_region_ids: dict[tuple[str, str], str] = {}
 
     @property
     def source_name(self) -> str:
@@ -62,6 +111,16 @@ class RapidAPIRedfinConnector(ListingConnector):
         province: str = "ON",
     ) -> ConnectorResult:
         """Fetch listings from Redfin Canada API."""
+        return asyncio.run(self.fetch_async(cities, max_price, province))
+
+    async def fetch_async(
+        self,
+        cities: list[str],
+        max_price: float,
+        province: str = "ON",
+        on_page: PageCallback | None = None,
+    ) -> ConnectorResult:
+        """Fetch all cities concurrently; results are merged (and deduped) in city order."""
         if not self.api_key:
             return ConnectorResult(
                 listings=[],
@@ -74,47 +133,154 @@ class RapidAPIRedfinConnector(ListingConnector):
         all_raw: list[dict] = []
         errors: list[str] = []
         seen_ids: set[str] = set()
+        province = province or "ON"
+
+        async with client_scope(self.client) as client:
+            ctx = self._fetch_context(client)
+            # Resolve regionIds first (known ones cost nothing) so cities that
+            # share a region collapse into one search-sale request
+            lookup_stats = {city: CityFetchStats(city=city) for city in cities}
+            lookups = await asyncio.gather(
+                *(self._region_id_for(city, province, ctx, st) for city, st in lookup_stats.items()),
+                return_exceptions=True,
+            )
+            region_of: dict[str, str] = {}
+            for (city, st), rid in zip(lookup_stats.items(), lookups):
+                if isinstance(rid, BaseException):
+                    st.status = "circuit_open" if isinstance(rid, CircuitOpenError) else "error"
+                    st.error = str(rid) or type(rid).__name__
+                elif not rid:
+                    st.status = "http_error"
+                    st.error = "Could not get regionId from auto-complete"
+                else:
+                    region_of[city] = rid
+
+            plan = plan_fetches(list(region_of), region_of.__getitem__)
+            by_label = {planned.label: planned for planned in plan}
+            outcomes = await fetch_cities(
+                list(by_label),
+                lambda label, stats: self._fetch_city(
+                    label, by_label[label].region, max_price, province, ctx, stats, on_page
+                ),
+            )
 
-        with httpx.Client(timeout=60) as client:
-            for i, city in enumerate(cities):
-                if i > 0:
-                    time.sleep(self.delay_seconds)
-                try:
-                    result = self._fetch_city(
-                        city, max_price, province or "ON", seen_ids, client
-                    )
-                    for lst in result.listings:
-                        if lst.id not in seen_ids:
-                            seen_ids.add(lst.id)
-                            all_listings.append(lst)
-                    all_raw.extend(result.raw_payloads)
-                    errors.extend(result.errors)
-                except Exception as e:
-                    errors.append(f"{city}: {e!s}")
+        for outcome, stats in outcomes:
+            if outcome is None:
+                errors.append(f"{stats.city}: {stats.error}")
+                continue
+            for lst in outcome.listings:
+                if lst.id not in seen_ids:
+                    seen_ids.add(lst.id)
+                    all_listings.append(lst)
+            all_raw.extend(outcome.raw_payloads)
+            errors.extend(outcome.errors)
+
+        city_stats = fan_out_stats(plan, outcomes)
+        for st in city_stats:
+            st.add_counts(lookup_stats.pop(st.city))
+        for city, st in lookup_stats.items():  # regionId lookup failed
+            errors.append(f"{city}: {st.error}")
+            city_stats.append(st)
+        order = {city: i for i, city in enumerate(cities)}
+        city_stats.sort(key=lambda st: order[st.city])
 
         return ConnectorResult(
             listings=all_listings,
             raw_payloads=all_raw,
             source=self.source_name,
             errors=errors,
+            city_stats=city_stats,
+        )
+
+    def _fetch_context(self, client: httpx.AsyncClient) -> FetchContext:
+        return FetchContext(
+            client=client,
+            throttle=HostThrottle(
+                max_concurrency=self.max_concurrency,
+                per_host_concurrency=self.per_host_concurrency,
+                limiters={self.host: self.rate_limiter},
+            ),
+            cache=self.cache,
+            retry=self.retry_policy,
+            breakers={self.host: self.circuit_breaker},
         )
 
-    def _get_region_id(self, city: str, province: str, client: httpx.Client) -> str | None:
+    async def resolve_region_ids(
+        self,
+        cities: list[str],
+        province: str = "ON",
+        force: bool = False,
+    ) -> tuple[dict[str, str], list[str]]:
+        """Resolve regionIds for *cities* (bulk warm-up). Returns (city -> regionId, errors)."""
+        if not self.api_key:
+            return {}, ["RAPIDAPI_KEY not set. Set env var or pass api_key."]
+        if force:
+            for city in cities:
+                self.region_ids.pop(region_key(city, province), None)
+
+        async with client_scope(self.client) as client:
+            ctx = self._fetch_context(client)
+            outcomes = await asyncio.gather(
+                *(self._region_id_for(city, province or "ON", ctx) for city in cities),
+                return_exceptions=True,
+            )
+
+        resolved: dict[str, str] = {}
+        errors: list[str] = []
+        for city, outcome in zip(cities, outcomes):
+            if isinstance(outcome, BaseException):
+                errors.append(f"{city}: {outcome!s}")
+            elif outcome:
+                resolved[city] = outcome
+            else:
+                errors.append(f"{city}: Could not get regionId from auto-complete")
+        return resolved, errors
+
+    async def _region_id_for(
+        self,
+        city: str,
+        province: str,
+        ctx: FetchContext,
+        stats: CityFetchStats | None = None,
+    ) -> str | None:
+        """Known regionId for city/province, else resolve via auto-complete and remember it."""
+        key = region_key(city, province)
+        rid = self.region_ids.get(key)
+        if rid:
+            return rid
+        rid = await self._get_region_id(city, province, ctx, stats)
+        if rid:
+            rid = str(rid)
+            self.region_ids[key] = rid
+            self.new_region_ids[key] = rid
+        return rid
+
+    async def _get_region_id(
+        self,
+        city: str,
+        province: str,
+        ctx: FetchContext,
+        stats: CityFetchStats | None = None,
+    ) -> str | None:
         """Get regionId from auto-complete for city/area."""
         headers = {
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": self.host,
         }
         query = f"{city}, {province}" if province else city
-        resp = client.get(
-            f"{self.base_url}/properties/auto-complete",
-            params={"query": query},
+        status, data = await request_json(
+            ctx,
+            "GET",
+            self.host,
+            self.base_url,
+            "/properties/auto-complete",
             headers=headers,
+            params={"query": query},
             timeout=30,
+            stats=stats,
         )
-        if resp.status_code != 200:
+        if status != 200 or not isinstance(data, dict):
             return None
-        data = resp.json()
         rows = (data.get("data") or [{}])[0].get("rows", []) if data.get("data") else []
         province_upper = (province or "").upper()
         city_lower = (city or "").lower()
@@ -141,69 +307,104 @@ class RapidAPIRedfinConnector(ListingConnector):
                 return rid
         return rows[0].get("id") if rows else None
 
-    def _fetch_city(
+    async def _fetch_city(
         self,
         city: str,
+        region_id: str,
         max_price: float,
         province: str,
-        seen_ids: set[str],
-        client: httpx.Client,
+        ctx: FetchContext,
+        stats: CityFetchStats,
+        on_page: PageCallback | None = None,
     ) -> ConnectorResult:
-        """Fetch listings for a single city via auto-complete + search-sale."""
-        region_id = self._get_region_id(city, province, client)
-        if not region_id:
-            return ConnectorResult(
-                listings=[],
-                raw_payloads=[],
-                source=self.source_name,
-                errors=[f"{city}: Could not get regionId from auto-complete"],
-            )
-
+        """Fetch every search-sale page for a city's resolved regionId."""
         headers = {
             "X-RapidAPI-Key": self.api_key,
             "X-RapidAPI-Host": self.host,
         }
-        resp = client.get(
-            f"{self.base_url}/properties/search-sale",
-            params={"regionId": region_id},
-            headers=headers,
-            timeout=60,
-        )
 
-        if resp.status_code != 200:
-            return ConnectorResult(
-                listings=[],
-                raw_payloads=[],
-                source=self.source_name,
-                errors=[f"{city}: HTTP {resp.status_code}"],
+        def fetch_page(page: int) -> Awaitable[tuple[int, Any]]:
+            params: dict[str, Any] = {"regionId": region_id}
+            if page > 1:
+                params["page"] = page
+            return request_json(
+                ctx,
+                "GET",
+                self.host,
+                self.base_url,
+                "/properties/search-sale",
+                headers=headers,
+                params=params,
+                timeout=60,
+                stats=stats,
             )
 
-        data = resp.json()
         listings: list[Listing] = []
         raw_list: list[dict] = []
+        errors: list[str] = []
+        last_raw: list[dict] = []
+        pages = last_count = 0
+        async with aclosing(
+            paginate(fetch_page, lambda d: len(self._response_items(d)), self.page_size, self.max_pages)
+        ) as page_iter:
+            async for page, status, data in page_iter:
+                if status != 200:
+                    if page == 1:
+                        stats.status = "http_error"
+                        stats.error = f"HTTP {status}"
+                        return ConnectorResult(
+                            listings=[],
+                            raw_payloads=[],
+                            source=self.source_name,
+                            errors=[f"{city}: HTTP {status}"],
+                        )
+                    errors.append(f"{city}: HTTP {status} on page {page}")
+                    break
+                page_listings, page_raw = self._normalize_page(data, city, max_price, province)
+                if page > 1 and page_raw == last_raw:
+                    break  # API ignored the page parameter
+                last_raw, pages, last_count = page_raw, page, len(self._response_items(data))
+                listings.extend(page_listings)
+                raw_list.extend(page_raw)
+                if on_page is not None:
+                    on_page(ListingPage(city, page, page_listings, page_raw, province, data))
+
+        if not errors and pages >= self.max_pages and last_count >= self.page_size:
+            errors.append(f"{city}: still full after {pages} pages (max_pages)")
+        if errors:
+            # Incomplete: keep what was fetched but don't treat unseen listings as removed
+            stats.status = "partial"
+            stats.error = errors[0].split(": ", 1)[-1]
+        return ConnectorResult(
+            listings=listings,
+            raw_payloads=raw_list,
+            source=self.source_name,
+            errors=errors,
+        )
 
-        items = data.get("data") or []
-        if not isinstance(items, list):
-            items = []
+    @staticmethod
+    def _response_items(data: Any) -> list:
+        """search-sale result items (``data`` array)."""
+        items = data.get("data") if isinstance(data, dict) else None
+        return items if isinstance(items, list) else []
 
-        for item in items:
+    def _normalize_page(
+        self, data: Any, city: str, max_price: float, province: str
+    ) -> tuple[list[Listing], list[dict]]:
+        """Normalize one search-sale page to Listings within the price band."""
+        listings: list[Listing] = []
+        raw_list: list[dict] = []
+        for item in self._response_items(data):
             if not isinstance(item, dict):
                 continue
             raw_list.append(item)
             try:
                 listing = self._item_to_listing(item, city, expected_province=province or "ON")
-                if listing and listing.id not in seen_ids:
-                    if self.min_price <= listing.price <= max_price:
-                        listings.append(listing)
+                if listing and self.min_price <= listing.price <= max_price:
+                    listings.append(listing)
             except Exception:
                 continue
-
-        return ConnectorResult(
-            listings=listings,
-            raw_payloads=raw_list,
-            source=self.source_name,
-            errors=[],
-        )
+        return listings, raw_list
 
     def _parse_price(self, val: Any) -> float:
         """Parse price from various formats."""
@@ -295,4 +496,5 @@ class RapidAPIRedfinConnector(ListingConnector):
             description=desc,
             url=url,
             raw_payload=item,
+            **promoted_payload_fields(item),
         )
@@ -0,0 +1,80 @@
+"""Token-bucket rate limiting shared by every connector hitting the same API host."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket: ``rate`` requests/sec sustained, up to ``burst`` back-to-back.
+
+    Tokens are reserved up front (the balance may go negative), so concurrent
+    callers queue behind each other in arrival order without a lock being held
+    while they wait. Safe to share across threads and event loops.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self._lock = threading.Lock()
+        self.rate = max(0.0, float(rate))
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def configure(self, rate: float, burst: int = 1) -> None:
+        """Update rate/burst in place (keeps the current token balance)."""
+        with self._lock:
+            self.rate = max(0.0, float(rate))
+            self.burst = max(1, int(burst))
+            self._tokens = min(self._tokens, float(self.burst))
+
+    def reserve(self) -> float:
+        """Take one token; return seconds the caller must wait before using it."""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.burst), self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        """Wait (asynchronously) until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def acquire_sync(self) -> None:
+        """Blocking variant of :meth:`acquire`."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+_HOST_LIMITERS: dict[str, TokenBucket] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_host_limiter(host: str, rate: float, burst: int = 1) -> TokenBucket:
+    """Return the process-wide bucket for *host*, creating or reconfiguring it."""
+    with _REGISTRY_LOCK:
+        bucket = _HOST_LIMITERS.get(host)
+        if bucket is None:
+            bucket = TokenBucket(rate, burst)
+            _HOST_LIMITERS[host] = bucket
+        else:
+            bucket.configure(rate, burst)
+        return bucket
+
+
+def reset_host_limiters() -> None:
+    """Forget all shared buckets (mainly for tests and benchmarks)."""
+    with _REGISTRY_LOCK:
+        _HOST_LIMITERS.clear()
@@ -0,0 +1,155 @@
+"""Record raw API responses during a fetch and replay them offline (no network, no quota)."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+from ..models import Listing
+from .base import ConnectorResult, ListingConnector, ListingPage
+from .rapidapi_realtor import RapidAPIRealtorConnector
+from .rapidapi_redfin import RapidAPIRedfinConnector
+
+ReplayPage = tuple[str, str, list[Listing], list[dict]]  # (city, province, listings, raw items)
+
+
+class ResponseRecorder:
+    """Append each normalised API page (with its decoded response) to a JSONL dump."""
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.pages = 0
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def record(self, source: str, page: ListingPage, max_price: float) -> None:
+        line = json.dumps(
+            {
+                "source": source,
+                "city": page.city,
+                "province": page.province,
+                "page": page.page,
+                "max_price": max_price,
+                "response": page.response,
+            },
+            default=str,
+        )
+        with self._lock:
+            self._file.write(line + "\n")
+            self.pages += 1
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+def replay_files(path: Path | str) -> list[Path]:
+    """
+    Dump files under *path*: the file itself, or a directory's dumps in run order.
+
+    A run's legacy ``listings_*.json`` is skipped when its full ``responses_*.jsonl`` exists.
+    """
+    path = Path(path)
+    if not path.is_dir():
+        return [path]
+    responses = {p.name.removeprefix("responses_").removesuffix(".jsonl"): p for p in path.glob("responses_*.jsonl")}
+    legacy = {p.name.removeprefix("listings_").removesuffix(".json"): p for p in path.glob("listings_*.json")}
+    runs = {**legacy, **responses}
+    return [runs[run_id] for run_id in sorted(runs)]
+
+
+class ReplayConnector(ListingConnector):
+    """
+    Re-normalise recorded responses exactly as a live fetch would.
+
+    Reads ``responses_<run_id>.jsonl`` dumps (written by :class:`ResponseRecorder`)
+    and legacy ``listings_<run_id>.json`` files (arrays of raw items; Redfin items
+    are recognised by their ``homeData`` key). Listings keep the source of the
+    connector that normalised them.
+    """
+
+    def __init__(self, path: Path | str, min_price: float = 20000) -> None:
+        self.path = Path(path)
+        self.min_price = min_price
+        self._realtor = RapidAPIRealtorConnector(api_key="replay", min_price=min_price)
+        self._redfin = RapidAPIRedfinConnector(api_key="replay", min_price=min_price)
+
+    @property
+    def source_name(self) -> str:
+        return "replay"
+
+    def fetch(
+        self,
+        cities: list[str],
+        max_price: float,
+        province: str = "ON",
+    ) -> ConnectorResult:
+        """
+        Normalise every recorded page for *province*; empty *cities* = all recorded cities.
+
+        A page is kept when its search city is in *cities*; otherwise only its
+        listings located in one of *cities* are kept.
+        """
+        wanted = {c.lower() for c in cities}
+        listings: list[Listing] = []
+        raw_payloads: list[dict] = []
+        errors: list[str] = []
+
+        if not self.path.exists():
+            return ConnectorResult([], [], self.source_name, [f"Replay path not found: {self.path}"])
+
+        for file in replay_files(self.path):
+            try:
+                if file.suffix == ".jsonl":
+                    pages = self._read_responses(file, max_price)
+                else:
+                    pages = self._read_legacy(file)
+                for city, page_province, page_listings, page_raw in pages:
+                    if page_province and page_province.upper() != (province or "ON").upper():
+                        continue
+                    if wanted and city.lower() not in wanted:
+                        page_listings = [l for l in page_listings if l.city.lower() in wanted]
+                    listings.extend(page_listings)
+                    raw_payloads.extend(page_raw)
+            except (OSError, ValueError) as e:
+                errors.append(f"{file.name}: {e}")
+
+        return ConnectorResult(listings, raw_payloads, self.source_name, errors)
+
+    def _read_responses(self, file: Path, max_price: float) -> Iterator[ReplayPage]:
+        """Yield (city, province, listings, raw items) per recorded page."""
+        with open(file, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                rec = json.loads(line)
+                city = str(rec.get("city") or "")
+                province = str(rec.get("province") or "ON")
+                if rec.get("source") == self._redfin.source_name:
+                    found, raw = self._redfin._normalize_page(rec.get("response"), city, max_price, province)
+                else:
+                    found, raw = self._realtor._normalize_response(rec.get("response"), city, province)
+                yield city, province, found, raw
+
+    def _read_legacy(self, file: Path) -> Iterator[ReplayPage]:
+        """Yield one (city, province, listings, raw items) per item of a listings_*.json dump."""
+        with open(file, encoding="utf-8") as f:
+            items = json.load(f)
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            try:
+                if "homeData" in item:
+                    addr = (item.get("homeData") or {}).get("addressInfo") or {}
+                    province = str(addr.get("state") or "ON")
+                    listing = self._redfin._item_to_listing(item, "", expected_province=province)
+                else:
+                    province = str(item.get("Province") or item.get("province") or item.get("ProvinceCode") or "ON")
+                    listing = self._realtor._item_to_listing(item, "", expected_province=province)
+            except Exception:
+                continue
+            city = listing.city if listing else ""
+            yield city, province, [listing] if listing else [], [item]
@@ -0,0 +1,133 @@
+"""Retry/backoff policy and per-host circuit breaker for connector HTTP calls."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(f"circuit open for {host} (too many consecutive failures)")
+        self.host = host
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with jitter; honours ``Retry-After`` up to a cap."""
+
+    max_attempts: int = 4
+    backoff_base: float = 1.0
+    backoff_max: float = 30.0
+    retry_after_max: float = 120.0
+    jitter: float = 0.25
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def should_retry(self, status: int) -> bool:
+        return status in self.retry_statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Seconds to wait before retry number *attempt* (1-based); None = give up."""
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.retry_after_max else None
+        base = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        return base * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    Stops calls to a host after ``failure_threshold`` consecutive failures.
+
+    After ``reset_timeout`` seconds one probe request is let through
+    (half-open); success closes the circuit, failure re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0) -> None:
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = float(reset_timeout)
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """True if a request may be sent now."""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release(self) -> None:
+        """End a probe without a verdict (the response said nothing about host health)."""
+        with self._lock:
+            self._probing = False
+
+
+_HOST_BREAKERS: dict[str, CircuitBreaker] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_circuit_breaker(
+    host: str,
+    failure_threshold: int = 5,
+    reset_timeout: float = 60.0,
+) -> CircuitBreaker:
+    """Return the process-wide breaker for *host* (created on first use)."""
+    with _REGISTRY_LOCK:
+        breaker = _HOST_BREAKERS.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _HOST_BREAKERS[host] = breaker
+        return breaker
+
+
+def reset_circuit_breakers() -> None:
+    """Forget all shared breakers (mainly for tests and benchmarks)."""
+    with _REGISTRY_LOCK:
+        _HOST_BREAKERS.clear()
@@ -0,0 +1,105 @@
+"""Bounding-box tiling for map-area searches (Realtor.ca).
+
+City boxes that mostly overlap are merged into one query; a box whose response
+looks truncated is split into quadrants and re-queried, down to a max depth.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .planner import PlannedFetch
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    """Lat/lng rectangle (degrees)."""
+
+    lat_min: float
+    lng_min: float
+    lat_max: float
+    lng_max: float
+
+    @classmethod
+    def around(cls, lat: float, lng: float, delta: float) -> BoundingBox:
+        """Square of half-width *delta* centred on (lat, lng)."""
+        return cls(lat - delta, lng - delta, lat + delta, lng + delta)
+
+    @property
+    def center(self) -> tuple[float, float]:
+        return (self.lat_min + self.lat_max) / 2, (self.lng_min + self.lng_max) / 2
+
+    @property
+    def area(self) -> float:
+        return max(0.0, self.lat_max - self.lat_min) * max(0.0, self.lng_max - self.lng_min)
+
+    def intersection(self, other: BoundingBox) -> BoundingBox | None:
+        box = BoundingBox(
+            max(self.lat_min, other.lat_min),
+            max(self.lng_min, other.lng_min),
+            min(self.lat_max, other.lat_max),
+            min(self.lng_max, other.lng_max),
+        )
+        return box if box.lat_min < box.lat_max and box.lng_min < box.lng_max else None
+
+    def union(self, other: BoundingBox) -> BoundingBox:
+        """Smallest box covering both."""
+        return BoundingBox(
+            min(self.lat_min, other.lat_min),
+            min(self.lng_min, other.lng_min),
+            max(self.lat_max, other.lat_max),
+            max(self.lng_max, other.lng_max),
+        )
+
+    def overlap(self, other: BoundingBox) -> float:
+        """Intersection area as a fraction of the smaller box (1.0 = one contains the other)."""
+        inter = self.intersection(other)
+        smaller = min(self.area, other.area)
+        if inter is None or smaller <= 0:
+            return 0.0
+        return inter.area / smaller
+
+    def quadrants(self) -> list[BoundingBox]:
+        """Split into four equal boxes (SW, SE, NW, NE)."""
+        lat_mid, lng_mid = self.center
+        return [
+            BoundingBox(self.lat_min, self.lng_min, lat_mid, lng_mid),
+            BoundingBox(self.lat_min, lng_mid, lat_mid, self.lng_max),
+            BoundingBox(lat_mid, self.lng_min, self.lat_max, lng_mid),
+            BoundingBox(lat_mid, lng_mid, self.lat_max, self.lng_max),
+        ]
+
+
+def merge_city_boxes(
+    boxes: dict[str, BoundingBox], min_overlap: float = 0.5
+) -> list[PlannedFetch]:
+    """
+    Group city boxes whose overlap (see :meth:`BoundingBox.overlap`) is at least
+    *min_overlap* (identical and contained boxes always qualify) into single
+    planned fetches whose region is the union box.
+
+    A pair is only merged if their union is no larger than the two boxes
+    queried separately, so chains of neighbours cannot snowball into one
+    county-sized query. Merging repeats until stable, since a grown tile can
+    reach new neighbours. Tiles keep first-seen city order. ``min_overlap > 1``
+    disables merging.
+    """
+    tiles = [PlannedFetch(box, [city]) for city, box in boxes.items()]
+    merged = True
+    while merged:
+        merged = False
+        for i, tile in enumerate(tiles):
+            for j in range(i + 1, len(tiles)):
+                other = tiles[j]
+                union = tile.region.union(other.region)
+                if (
+                    tile.region.overlap(other.region) >= min_overlap
+                    and union.area <= tile.region.area + other.region.area
+                ):
+                    tiles[i] = PlannedFetch(union, tile.cities + other.cities)
+                    del tiles[j]
+                    merged = True
+                    break
+            if merged:
+                break
+    return tiles
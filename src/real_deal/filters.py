@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from .keywords import compile_keywords
 from .models import Listing
 
 # Fields commonly present in API payloads (search without full JSON serialize)
@@ -39,6 +40,23 @@ def _payload_search_text(payload: dict, max_depth: int = 4) -> str:
     return " ".join(parts).lower()
 
 
+def listing_search_text(listing: Listing) -> str:
+    """
+    Lowercased text keyword filters match against (description, type, address + payload text).
+
+    Computed on first use and cached on ``listing.search_text``; listings loaded
+    from storage arrive with it already set.
+    """
+    if listing.search_text is not None:
+        return listing.search_text
+    text_fields = ("description", "property_type", "address")
+    combined = " ".join(str(getattr(listing, f, "")) for f in text_fields).lower()
+    if listing.raw_payload:
+        combined = f"{combined} {_payload_search_text(listing.raw_payload)}"
+    listing.search_text = combined
+    return combined
+
+
 def filter_listings(
     listings: list[Listing],
     include_keywords: list[str],
@@ -51,21 +69,21 @@ def filter_listings(
     - Must match at least one include keyword (in description or property_type)
     - Must not match any exclude keyword
     - Price must be >= min_price and <= max_price
+
+    ``Storage.load_listings(include_keywords=..., exclude_keywords=...)`` applies
+    the same keyword rules in DuckDB over the stored ``search_text``.
     """
-    include_lower = [kw.lower() for kw in include_keywords] if include_keywords else []
-    exclude_lower = [kw.lower() for kw in exclude_keywords] if exclude_keywords else []
-    text_fields = ("description", "property_type", "address")
+    include = compile_keywords(tuple(kw.lower() for kw in include_keywords or []))
+    exclude = compile_keywords(tuple(kw.lower() for kw in exclude_keywords or []))
     result: list[Listing] = []
 
     for listing in listings:
         if listing.price < min_price or listing.price > max_price:
             continue
-        combined = " ".join(str(getattr(listing, f, "")) for f in text_fields).lower()
-        if listing.raw_payload:
-            combined = f"{combined} {_payload_search_text(listing.raw_payload)}"
-        if exclude_lower and any(kw in combined for kw in exclude_lower):
+        combined = listing_search_text(listing)
+        if exclude and exclude.search_any(combined):
             continue
-        if include_lower and not any(kw in combined for kw in include_lower):
+        if include and not include.search_any(combined):
             continue
         result.append(listing)
     return result
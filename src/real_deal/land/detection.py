@@ -6,6 +6,7 @@ import re
 from typing import Any
 
 from ..listing_classification import is_land_listing
+from ..listing_utils import listing_promoted_fields
 from ..models import Listing
 from .models import LandMetrics, LandSignals
 
@@ -43,7 +44,7 @@ def is_land_candidate(listing: Listing) -> bool:
         url=listing.url,
         bedrooms=listing.bedrooms,
         bathrooms=listing.bathrooms,
-        raw_payload=listing.raw_payload,
+        property_type_code=listing_promoted_fields(listing)["property_type_code"],
     )
 
 
@@ -79,18 +80,10 @@ def parse_land_metrics(
         frontage = frontage or float(dm.group(1))
         depth = float(dm.group(2))
 
-    # Redfin lot size in sqft in raw payload
-    if acres is None and listing.raw_payload:
-        hd = listing.raw_payload.get("homeData") or listing.raw_payload
-        lot = hd.get("lotSize") or {}
-        amt = lot.get("amount")
-        if amt is not None:
-            try:
-                sqft = float(str(amt).replace(",", ""))
-                if sqft > 100:
-                    acres = sqft / 43560.0
-            except ValueError:
-                pass
+    # Redfin lot size in sqft (promoted from the raw payload at ingest)
+    lot_size_sqft = listing_promoted_fields(listing)["lot_size_sqft"]
+    if acres is None and lot_size_sqft is not None and lot_size_sqft > 100:
+        acres = lot_size_sqft / 43560.0
 
     if acres is None or acres <= 0:
         acres = default_acres_if_unknown
@@ -5,6 +5,9 @@ from __future__ import annotations
 import re
 from typing import Any
 
+from .keywords import KeywordMatcher
+from .models import LazyPayload
+
 # Redfin Canada API: type 8 is vacant land/lots in practice (not townhouse).
 REDFIN_PROPERTY_TYPE_LAND = frozenset({8, 10})
 
@@ -39,6 +42,7 @@ _LAND_TEXT_KEYWORDS = (
     "undeveloped",
     "no structure",
 )
+_LAND_TEXT_MATCHER = KeywordMatcher(_LAND_TEXT_KEYWORDS)
 
 
 def _redfin_property_type_num(raw_payload: dict[str, Any] | None) -> int | None:
@@ -63,9 +67,13 @@ def is_land_listing(
     bedrooms: int = 0,
     bathrooms: float = 0,
     raw_payload: dict[str, Any] | None = None,
+    property_type_code: int | None = None,
 ) -> bool:
-    """Return True if listing is vacant land / lot (land underwriting pipeline, not residential)."""
-    ptype_num = _redfin_property_type_num(raw_payload)
+    """Return True if listing is vacant land / lot (land underwriting pipeline, not residential).
+
+    ``property_type_code`` (promoted at ingest) takes precedence over reading ``raw_payload``.
+    """
+    ptype_num = property_type_code if property_type_code is not None else _redfin_property_type_num(raw_payload)
     if ptype_num is not None and ptype_num in REDFIN_PROPERTY_TYPE_LAND:
         return True
 
@@ -77,7 +85,7 @@ def is_land_listing(
         return True
 
     combined = f"{address} {description} {url}".lower()
-    if any(kw in combined for kw in _LAND_TEXT_KEYWORDS):
+    if _LAND_TEXT_MATCHER.search_any(combined):
         return True
 
     if _LAND_ADDRESS_PATTERN.search(address or ""):
@@ -100,6 +108,7 @@ def is_land_listing(
 
 def is_land_from_listing(listing: Any) -> bool:
     """Convenience wrapper for Listing models."""
+    raw_payload = getattr(listing, "raw_payload", None)
     return is_land_listing(
         address=getattr(listing, "address", "") or "",
         property_type=getattr(listing, "property_type", "") or "",
@@ -107,5 +116,7 @@ def is_land_from_listing(listing: Any) -> bool:
         url=getattr(listing, "url", "") or "",
         bedrooms=int(getattr(listing, "bedrooms", 0) or 0),
         bathrooms=float(getattr(listing, "bathrooms", 0) or 0),
-        raw_payload=getattr(listing, "raw_payload", None),
+        # Read only when the type code was not promoted (Storage's LazyPayload rows always were)
+        raw_payload=None if isinstance(raw_payload, LazyPayload) else raw_payload,
+        property_type_code=getattr(listing, "property_type_code", None),
     )
@@ -2,7 +2,122 @@
 
 from __future__ import annotations
 
-from .models import Listing
+import hashlib
+import json
+from typing import Any
+
+from .listing_classification import _redfin_property_type_num
+from .models import LazyPayload, Listing
+
+# Raw-payload fields that feed classification/underwriting (Realtor top level, Redfin homeData);
+# volatile fields such as photo URLs or "time on site" are deliberately left out
+_HASH_PAYLOAD_KEYS = (
+    "hoaDues", "lotSize", "propertyType", "sqFt", "yearBuilt",
+    "LeaseRent", "PropertyType", "Building", "Land",
+)
+
+
+def _payload_amount(hd: dict[str, Any], key: str) -> float | None:
+    """``hd[key]["amount"]`` as a float (Redfin money/size objects), else None."""
+    obj = hd.get(key)
+    amount = obj.get("amount") if isinstance(obj, dict) else None
+    if not amount:
+        return None
+    try:
+        return float(str(amount).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def promoted_payload_fields(raw_payload: dict[str, Any] | None) -> dict[str, Any]:
+    """
+    Listing kwargs for the raw-payload fields read on hot paths.
+
+    hoa_dues (monthly, unvalidated), property_type_code (Redfin numeric type)
+    and lot_size_sqft, so classification and underwriting never need the payload.
+    """
+    if not raw_payload or not isinstance(raw_payload, dict):
+        return {"hoa_dues": None, "property_type_code": None, "lot_size_sqft": None}
+    hd = raw_payload.get("homeData") or raw_payload
+    return {
+        "hoa_dues": _payload_amount(hd, "hoaDues"),
+        "property_type_code": _redfin_property_type_num(raw_payload),
+        "lot_size_sqft": _payload_amount(hd, "lotSize"),
+    }
+
+
+def listing_promoted_fields(listing: Listing) -> dict[str, Any]:
+    """
+    *listing*'s promoted payload fields, with missing ones read from its raw payload.
+
+    Covers listings built without the promoted fields; Storage payloads
+    (:class:`LazyPayload`) are not parsed since the stored columns were promoted from them.
+    """
+    fields = {
+        "hoa_dues": listing.hoa_dues,
+        "property_type_code": listing.property_type_code,
+        "lot_size_sqft": listing.lot_size_sqft,
+    }
+    if None in fields.values() and not isinstance(listing.raw_payload, LazyPayload):
+        from_payload = promoted_payload_fields(listing.raw_payload)
+        fields = {k: v if v is not None else from_payload[k] for k, v in fields.items()}
+    return fields
+
+
+def listing_hoa_dues(listing: Listing) -> float | None:
+    """
+    Monthly HOA dues (unvalidated): the promoted field, else read from the raw payload.
+
+    Listings built without the promoted fields still carry the Redfin fee in
+    ``raw_payload``; Storage payloads (:class:`LazyPayload`) are not parsed
+    since the stored column was promoted from them.
+    """
+    if listing.hoa_dues is not None or isinstance(listing.raw_payload, LazyPayload):
+        return listing.hoa_dues
+    return promoted_payload_fields(listing.raw_payload)["hoa_dues"]
+
+
+def plain_payload(raw_payload: dict[str, Any] | None) -> dict[str, Any]:
+    """*raw_payload* as a plain dict (materialises a :class:`LazyPayload`)."""
+    if isinstance(raw_payload, LazyPayload):
+        return raw_payload.copy()
+    return raw_payload or {}
+
+
+def listing_content_hash(listing: Listing) -> str:
+    """Hash of the fields a re-fetch can change (price, text, key payload fields)."""
+    raw = listing.raw_payload or {}
+    hd = raw.get("homeData") or raw
+    payload = {k: hd.get(k, raw.get(k)) for k in _HASH_PAYLOAD_KEYS if k in hd or k in raw}
+    content = [
+        listing.price,
+        listing.address,
+        listing.city,
+        listing.province,
+        listing.postal_code,
+        listing.bedrooms,
+        listing.bathrooms,
+        listing.property_type,
+        listing.description,
+        listing.url,
+        payload,
+    ]
+    blob = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
+
+
+def underwriting_input_hash(listing: Listing) -> str:
+    """Hash of the listing fields residential underwriting reads (id/address/url aside)."""
+    content = [
+        listing.price,
+        listing.city,
+        listing.bedrooms,
+        listing.property_type,
+        listing.description,
+        listing_hoa_dues(listing),
+    ]
+    blob = json.dumps(content, default=str)
+    return hashlib.sha256(blob.encode()).hexdigest()[:32]
 
 
 def listing_address_key(listing: Listing) -> tuple[str, str, int]:
@@ -2,11 +2,79 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
+class LazyPayload(dict):
+    """
+    Raw API payload kept as JSON text until first read.
+
+    Storage hands these out so loading listings does not parse every blob;
+    the hot payload fields are promoted to Listing attributes instead.
+    Copies as a plain dict; pickles as the unparsed JSON until first read
+    (cheap hand-off to worker processes).
+    """
+
+    __slots__ = ("_json",)
+
+    def __init__(self, raw_json: str) -> None:
+        super().__init__()
+        self._json: str | None = raw_json
+
+    def _load(self) -> LazyPayload:
+        if self._json is not None:
+            text, self._json = self._json, None
+            data = json.loads(text)
+            if isinstance(data, dict):
+                dict.update(self, data)
+        return self
+
+    @property
+    def loaded(self) -> bool:
+        return self._json is None
+
+    def __getitem__(self, key: Any) -> Any:
+        return dict.__getitem__(self._load(), key)
+
+    def __contains__(self, key: object) -> bool:
+        return dict.__contains__(self._load(), key)
+
+    def __iter__(self):
+        return dict.__iter__(self._load())
+
+    def __len__(self) -> int:
+        return dict.__len__(self._load())
+
+    def __eq__(self, other: object) -> bool:
+        return dict.__eq__(self._load(), other)
+
+    def __repr__(self) -> str:
+        return dict.__repr__(self._load())
+
+    def __reduce__(self):
+        if self._json is not None:
+            return (LazyPayload, (self._json,))
+        return (dict, (self.copy(),))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return dict.get(self._load(), key, default)
+
+    def keys(self):
+        return dict.keys(self._load())
+
+    def values(self):
+        return dict.values(self._load())
+
+    def items(self):
+        return dict.items(self._load())
+
+    def copy(self) -> dict[str, Any]:
+        return dict(dict.items(self._load()))
+
+
 @dataclass
 class Listing:
     """Normalized listing schema (source-agnostic)."""
@@ -25,6 +93,12 @@ class Listing:
     url: str
     raw_payload: dict[str, Any]
     fetched_at: datetime = field(default_factory=datetime.utcnow)
+    # Promoted from raw_payload at ingest (see listing_utils.promoted_payload_fields)
+    hoa_dues: float | None = None
+    property_type_code: int | None = None
+    lot_size_sqft: float | None = None
+    # Lowercased keyword-search text; filters.listing_search_text fills it once (storage persists it)
+    search_text: str | None = field(default=None, repr=False, compare=False)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -44,7 +118,7 @@ class Listing:
         }
 
 
-@dataclass
+@dataclass(frozen=True)
 class UnderwritingAssumptions:
     """Underwriting assumptions (from config or overrides)."""
 
@@ -98,7 +172,7 @@ class SfhPriceTier:
     max_rent: float | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class RentEstimationParams:
     """Rent estimation parameters."""
 
@@ -144,6 +218,12 @@ class UnderwritingResult:
     confidence_score: float = 0.5
     signals: dict[str, Any] = field(default_factory=dict)
     confidence_notes: list[str] = field(default_factory=list)
+    stress_dscr: float = 0.0
+    # Incremental re-underwriting bookkeeping (stored as deals_underwritten columns, not in to_dict)
+    input_hash: str | None = None
+    config_fingerprint: str | None = None
+    thresholds_fingerprint: str | None = None
+    carried_from_run: str | None = None  # run whose computed result this one reuses
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -157,6 +237,7 @@ class UnderwritingResult:
             "dscr": self.dscr,
             "stress_rent_monthly": self.stress_rent_monthly,
             "stress_cashflow_monthly": self.stress_cashflow_monthly,
+            "stress_dscr": self.stress_dscr,
             "margin_of_safety_score": self.margin_of_safety_score,
             "passed": self.passed,
             "reason_flags": self.reason_flags,
@@ -186,8 +267,63 @@ class UnderwritingResult:
                 "min_dscr": self.thresholds.min_dscr,
                 "min_cash_on_cash": self.thresholds.min_cash_on_cash,
                 "require_stress_dscr": self.thresholds.require_stress_dscr,
+                "margin_of_safety_base": self.thresholds.margin_of_safety_base,
+                "margin_of_safety_stress_positive": self.thresholds.margin_of_safety_stress_positive,
+                "margin_of_safety_stress_threshold": self.thresholds.margin_of_safety_stress_threshold,
+                "margin_of_safety_coc": self.thresholds.margin_of_safety_coc,
+                "margin_of_safety_dscr": self.thresholds.margin_of_safety_dscr,
             },
             "confidence_score": self.confidence_score,
             "signals": self.signals,
             "confidence_notes": self.confidence_notes,
         }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any], listing: Listing | None = None) -> UnderwritingResult:
+        """
+        Rebuild a result from :meth:`to_dict` output (e.g. a stored ``full_result``).
+
+        Pass *listing* to attach the current Listing; otherwise one is rebuilt from
+        the stored summary (without raw_payload). Raises KeyError/TypeError for
+        dicts written before all fields were serialised.
+        """
+        if listing is None:
+            ld = d["listing"]
+            listing = Listing(
+                id=ld["id"],
+                source=ld["source"],
+                address=ld["address"],
+                city=ld["city"],
+                province=ld["province"],
+                postal_code=ld["postal_code"],
+                price=ld["price"],
+                bedrooms=ld["bedrooms"],
+                bathrooms=ld["bathrooms"],
+                property_type=ld["property_type"],
+                description=ld["description"],
+                url=ld["url"],
+                raw_payload={},
+                fetched_at=datetime.fromisoformat(ld["fetched_at"]),
+            )
+        return cls(
+            listing_id=d["listing_id"],
+            listing=listing,
+            rent_monthly=d["rent_monthly"],
+            noi_annual=d["noi_annual"],
+            cashflow_monthly=d["cashflow_monthly"],
+            cap_rate=d["cap_rate"],
+            cash_on_cash=d["cash_on_cash"],
+            dscr=d["dscr"],
+            stress_rent_monthly=d["stress_rent_monthly"],
+            stress_cashflow_monthly=d["stress_cashflow_monthly"],
+            margin_of_safety_score=d["margin_of_safety_score"],
+            passed=d["passed"],
+            reason_flags=list(d["reason_flags"]),
+            assumptions=UnderwritingAssumptions(**d["assumptions"]),
+            stress_params=StressTestParams(**d["stress_params"]),
+            thresholds=PassFailThresholds(**d["thresholds"]),
+            confidence_score=d["confidence_score"],
+            signals=dict(d["signals"]),
+            confidence_notes=list(d["confidence_notes"]),
+            stress_dscr=d["stress_dscr"],
+        )
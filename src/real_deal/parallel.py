@@ -0,0 +1,88 @@
+"""Process-pool underwriting: shard listings into chunks across worker processes."""
+
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from .models import Listing
+
+# One engine per worker process, built from the config by _init_worker
+_ENGINE: Any = None
+
+_MIN_CHUNK = 64  # keeps underwrite_many on its vectorised batch path
+_MAX_CHUNK = 2000
+_CHUNKS_PER_WORKER = 4  # a few chunks each so uneven chunks balance out
+
+
+def default_workers() -> int:
+    """Usable CPU count (affinity-aware where supported)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _init_worker(engine_cls: type, config: dict[str, Any], engine_kwargs: dict[str, Any]) -> None:
+    global _ENGINE
+    _ENGINE = engine_cls(config=config, **engine_kwargs)
+
+
+def _underwrite_chunk(chunk: list[Listing], kwargs: dict[str, Any]) -> tuple[list[tuple[int, Any]], dict]:
+    """
+    Underwrite *chunk*; results come back without their listing (the parent re-attaches it),
+    along with any signal-cache entries computed for the chunk.
+    """
+    positions = {id(l): i for i, l in enumerate(chunk)}
+    out = []
+    for r in _ENGINE.underwrite_many(chunk, **kwargs):
+        i = positions[id(r.listing)]
+        r.listing = None
+        out.append((i, r))
+    cache = getattr(_ENGINE, "signal_cache", None)
+    return out, cache.take_new() if cache is not None else {}
+
+
+def underwrite_parallel(
+    engine_cls: type,
+    config: dict[str, Any],
+    listings: list[Listing],
+    workers: int,
+    chunk_size: int | None = None,
+    engine_kwargs: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> list[Any]:
+    """
+    ``engine_cls(config=config, **engine_kwargs).underwrite_many(listings, **kwargs)``
+    across *workers* processes.
+
+    Listings are split into contiguous chunks and results are returned in input
+    order, so output is identical to the single-process call. ``workers <= 1``
+    (or a single chunk) runs in-process. A ``signal_cache`` in *engine_kwargs*
+    is copied to each worker and receives the entries the workers compute.
+    """
+    engine_kwargs = engine_kwargs or {}
+    if chunk_size is None:
+        chunk_size = math.ceil(len(listings) / max(1, workers * _CHUNKS_PER_WORKER))
+        chunk_size = max(_MIN_CHUNK, min(_MAX_CHUNK, chunk_size))
+    if workers <= 1 or len(listings) <= chunk_size:
+        return engine_cls(config=config, **engine_kwargs).underwrite_many(listings, **kwargs)
+
+    chunks = [listings[i : i + chunk_size] for i in range(0, len(listings), chunk_size)]
+    signal_cache = engine_kwargs.get("signal_cache")
+    results: list[Any] = []
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(chunks)),
+        initializer=_init_worker,
+        initargs=(engine_cls, config, engine_kwargs),
+    ) as pool:
+        outputs = pool.map(_underwrite_chunk, chunks, [kwargs] * len(chunks))
+        for chunk, (chunk_results, new_signals) in zip(chunks, outputs):
+            for i, r in chunk_results:
+                r.listing = chunk[i]
+                results.append(r)
+            if signal_cache is not None:
+                signal_cache.update(new_signals)
+    return results
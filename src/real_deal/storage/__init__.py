@@ -1,9 +1,11 @@
 """Storage layer for listings and underwriting results."""
 
-from .db import Storage
+from .db import ListingSaveResult, PriorDeal, Storage
 from .export import export_csv, export_json
 
 __all__ = [
+    "ListingSaveResult",
+    "PriorDeal",
     "Storage",
     "export_csv",
     "export_json",
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import duckdb
 
-from ..models import Listing, UnderwritingResult
+from ..filters import listing_search_text
+from ..listing_utils import listing_content_hash, listing_promoted_fields, plain_payload
+from ..models import LazyPayload, Listing, UnderwritingResult
+from .bulk import bulk_upsert, stage_rows
 
 try:
     from ..land.models import LandUnderwritingResult
@@ -17,11 +22,108 @@ except ImportError:
     LandUnderwritingResult = None  # type: ignore[misc, assignment]
 
 
-def _serialize_datetime(obj: Any) -> Any:
-    """JSON serializer for datetime objects."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+@dataclass
+class ListingSaveResult:
+    """What a :meth:`Storage.save_listings` call changed."""
+
+    new: int = 0
+    changed: int = 0  # content hash differs, or a removed listing came back
+    unchanged: int = 0  # only last_seen_at touched
+    removed: int = 0  # active rows in scope that were not in this save
+    skipped: int = 0  # already stored, left as they are (insert_only saves)
+    changed_ids: list[str] = field(default_factory=list)  # new + changed, for downstream stages
+
+
+@dataclass
+class PriorDeal:
+    """A listing's result in the latest run, as :meth:`Storage.load_prior_deals` returns it."""
+
+    run_id: str  # run that computed full_result (carried rows point back to it)
+    input_hash: str | None
+    config_fingerprint: str | None
+    thresholds_fingerprint: str | None  # thresholds full_result was evaluated with
+    full_result: dict[str, Any]
+
+
+_LISTING_COLUMNS = [
+    "id", "source", "address", "city", "province", "postal_code", "price",
+    "bedrooms", "bathrooms", "property_type", "description", "url",
+    "raw_payload", "fetched_at", "hoa_dues", "property_type_code", "lot_size_sqft", "search_text",
+]
+
+# Promoted raw_payload fields: SQL backfill for rows stored before they were columns
+_PROMOTED_BACKFILL = """
+    UPDATE listings_raw SET
+        hoa_dues = TRY_CAST(replace(coalesce(
+            json_extract_string(raw_payload, '$.homeData.hoaDues.amount'),
+            json_extract_string(raw_payload, '$.hoaDues.amount')), ',', '') AS DOUBLE),
+        property_type_code = TRY_CAST(coalesce(
+            json_extract_string(raw_payload, '$.homeData.propertyType'),
+            json_extract_string(raw_payload, '$.propertyType')) AS INTEGER),
+        lot_size_sqft = TRY_CAST(replace(coalesce(
+            json_extract_string(raw_payload, '$.homeData.lotSize.amount'),
+            json_extract_string(raw_payload, '$.lotSize.amount')), ',', '') AS DOUBLE)
+"""
+
+# Column name -> type for bulk writes (JSON values are passed as Python objects)
+_LISTING_WRITE_COLUMNS = {
+    "id": "TEXT", "source": "TEXT", "address": "TEXT", "city": "TEXT", "province": "TEXT",
+    "postal_code": "TEXT", "price": "REAL", "bedrooms": "INTEGER", "bathrooms": "REAL",
+    "property_type": "TEXT", "description": "TEXT", "url": "TEXT", "raw_payload": "JSON",
+    "fetched_at": "TIMESTAMP", "hoa_dues": "REAL", "property_type_code": "INTEGER",
+    "lot_size_sqft": "REAL", "search_text": "TEXT", "content_hash": "TEXT", "first_seen_at": "TIMESTAMP",
+    "last_seen_at": "TIMESTAMP", "changed_at": "TIMESTAMP", "removed_at": "TIMESTAMP",
+}
+_EVENT_COLUMNS = {
+    "listing_id": "TEXT", "source": "TEXT", "event_type": "TEXT",
+    "old_price": "REAL", "new_price": "REAL", "occurred_at": "TIMESTAMP",
+}
+_DEAL_COLUMNS = {
+    "run_id": "TEXT", "listing_id": "TEXT", "rent_monthly": "REAL", "noi_annual": "REAL",
+    "cashflow_monthly": "REAL", "cap_rate": "REAL", "cash_on_cash": "REAL", "dscr": "REAL",
+    "stress_cashflow_monthly": "REAL", "margin_of_safety_score": "REAL", "passed": "INTEGER",
+    "reason_flags": "JSON", "full_result": "JSON", "created_at": "TIMESTAMP",
+    "input_hash": "TEXT", "config_fingerprint": "TEXT", "thresholds_fingerprint": "TEXT",
+    "carried_from_run": "TEXT",
+}
+_SIGNAL_CACHE_COLUMNS = {
+    "description_hash": "TEXT", "fields_hash": "TEXT", "extractor_version": "INTEGER",
+    "signals": "JSON", "created_at": "TIMESTAMP",
+}
+_LAND_DEAL_COLUMNS = {
+    "run_id": "TEXT", "listing_id": "TEXT", "underwriting_score": "REAL",
+    "buildability_score": "REAL", "servicing_score": "REAL", "environmental_risk": "REAL",
+    "estimated_servicing_cost": "REAL", "estimated_all_in_basis": "REAL", "estimated_roi": "REAL",
+    "land_type": "TEXT", "exit_strategy_score": "REAL", "ai_summary": "TEXT",
+    "recommendation": "TEXT", "full_result": "JSON", "created_at": "TIMESTAMP",
+}
+
+
+def _row_to_listing(d: dict[str, Any]) -> Listing:
+    """Build a Listing from a (possibly projected) listings_raw row; unprojected fields get defaults."""
+    raw = d.get("raw_payload")
+    if isinstance(raw, str):
+        raw = LazyPayload(raw)  # parsed on first access only
+    return Listing(
+        id=d["id"],
+        source=d.get("source", ""),
+        address=d.get("address", ""),
+        city=d.get("city", ""),
+        province=d.get("province", ""),
+        postal_code=d.get("postal_code", ""),
+        price=d.get("price", 0.0),
+        bedrooms=d.get("bedrooms", 0),
+        bathrooms=d.get("bathrooms", 0.0),
+        property_type=d.get("property_type", ""),
+        description=d.get("description", ""),
+        url=d.get("url", ""),
+        raw_payload=raw if raw is not None else {},
+        fetched_at=d.get("fetched_at") or datetime.utcnow(),
+        hoa_dues=d.get("hoa_dues"),
+        property_type_code=d.get("property_type_code"),
+        lot_size_sqft=d.get("lot_size_sqft"),
+        search_text=d.get("search_text"),
+    )
 
 
 class Storage:
@@ -57,9 +159,38 @@ class Storage:
                 description TEXT,
                 url TEXT,
                 raw_payload JSON,
-                fetched_at TIMESTAMP
+                fetched_at TIMESTAMP,
+                hoa_dues REAL,
+                property_type_code INTEGER,
+                lot_size_sqft REAL,
+                search_text TEXT,
+                content_hash TEXT,
+                first_seen_at TIMESTAMP,
+                last_seen_at TIMESTAMP,
+                changed_at TIMESTAMP,
+                removed_at TIMESTAMP
             )
         """)
+        # Databases created before incremental fetch / promoted payload fields
+        existing_cols = {
+            r[0]
+            for r in conn.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = 'listings_raw'"
+            ).fetchall()
+        }
+        for column in ("content_hash TEXT", "first_seen_at TIMESTAMP", "last_seen_at TIMESTAMP",
+                       "changed_at TIMESTAMP", "removed_at TIMESTAMP", "hoa_dues REAL",
+                       "property_type_code INTEGER", "lot_size_sqft REAL", "search_text TEXT"):
+            conn.execute(f"ALTER TABLE listings_raw ADD COLUMN IF NOT EXISTS {column}")
+        if "hoa_dues" not in existing_cols:
+            conn.execute(_PROMOTED_BACKFILL)
+        if "search_text" not in existing_cols:
+            self._backfill_search_text(conn)
+        conn.execute("""
+            UPDATE listings_raw
+            SET first_seen_at = fetched_at, last_seen_at = fetched_at, changed_at = fetched_at
+            WHERE first_seen_at IS NULL
+        """)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS deals_underwritten (
                 run_id TEXT,
@@ -76,9 +207,17 @@ class Storage:
                 reason_flags JSON,
                 full_result JSON,
                 created_at TIMESTAMP,
+                input_hash TEXT,
+                config_fingerprint TEXT,
+                thresholds_fingerprint TEXT,
+                carried_from_run TEXT,
                 PRIMARY KEY (run_id, listing_id)
             )
         """)
+        # Incremental re-underwriting: carried rows keep full_result NULL and point at carried_from_run
+        for column in ("input_hash TEXT", "config_fingerprint TEXT", "thresholds_fingerprint TEXT",
+                       "carried_from_run TEXT"):
+            conn.execute(f"ALTER TABLE deals_underwritten ADD COLUMN IF NOT EXISTS {column}")
         conn.execute("""
             CREATE TABLE IF NOT EXISTS land_underwritten (
                 run_id TEXT,
@@ -99,43 +238,257 @@ class Storage:
                 PRIMARY KEY (run_id, listing_id)
             )
         """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS redfin_regions (
+                city TEXT,
+                province TEXT,
+                region_id TEXT,
+                resolved_at TIMESTAMP,
+                PRIMARY KEY (city, province)
+            )
+        """)
+        # Append-only history written by save_listings (first_seen, price_change, delisted, relisted)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS listing_events (
+                listing_id TEXT,
+                source TEXT,
+                event_type TEXT,
+                old_price REAL,
+                new_price REAL,
+                occurred_at TIMESTAMP
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_listing_events_listing ON listing_events (listing_id)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_listing_events_type ON listing_events (event_type, occurred_at)")
+        # Description signals memoised by underwriting.cache.SignalCache
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS signal_cache (
+                description_hash TEXT,
+                fields_hash TEXT,
+                extractor_version INTEGER,
+                signals JSON,
+                created_at TIMESTAMP,
+                PRIMARY KEY (description_hash, fields_hash, extractor_version)
+            )
+        """)
 
-    def save_listings(self, listings: list[Listing]) -> None:
-        """Upsert listings into listings_raw."""
-        if not listings:
-            return
+    def save_listings(
+        self,
+        listings: list[Listing],
+        complete: dict[str, list[str]] | None = None,
+        seen_ids: set[str] | None = None,
+        insert_only: bool = False,
+    ) -> ListingSaveResult:
+        """
+        Upsert listings into listings_raw, writing only new or changed rows.
+
+        Rows whose content hash (see :func:`listing_content_hash`) is unchanged
+        only get ``last_seen_at`` bumped. *complete* maps a source to the cities
+        it fetched completely this run; active rows from those source/cities that
+        are neither in *listings* nor in *seen_ids* (e.g. fetched but filtered out)
+        are marked removed. New, repriced, delisted and relisted listings are
+        appended to listing_events.
+
+        With *insert_only* (replays of older dumps) only listings not yet stored
+        are written: existing rows are left as they are and no events are recorded.
+        """
+        result = ListingSaveResult()
+        if not listings and not complete:
+            return result
         conn = self._connect()
-        rows = [
-            [
-                l.id,
-                l.source,
-                l.address,
-                l.city,
-                l.province,
-                l.postal_code,
-                l.price,
-                l.bedrooms,
-                l.bathrooms,
-                l.property_type,
-                l.description,
-                l.url,
-                json.dumps(l.raw_payload, default=str),
-                l.fetched_at,
-            ]
-            for l in listings
-        ]
-        conn.executemany(
-            """
-            INSERT OR REPLACE INTO listings_raw
-            (id, source, address, city, province, postal_code, price, bedrooms,
-             bathrooms, property_type, description, url, raw_payload, fetched_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
+        now = datetime.utcnow()
+
+        incoming = {l.id: l for l in listings}
+        existing = {
+            lid: (content_hash, first_seen_at, removed_at, price)
+            for lid, content_hash, first_seen_at, removed_at, price in conn.execute(
+                "SELECT id, content_hash, first_seen_at, removed_at, price FROM listings_raw"
+            ).fetchall()
+        }
+
+        rows = []
+        events: list[list[Any]] = []
+        unchanged_ids: list[str] = []
+        for lid, l in incoming.items():
+            content_hash = listing_content_hash(l)
+            prev = existing.get(lid)
+            if insert_only and prev is not None:
+                result.skipped += 1
+                continue
+            if prev is None:
+                result.new += 1
+                first_seen = now
+                if not insert_only:
+                    events.append([lid, l.source, "first_seen", None, l.price, now])
+            elif prev[0] == content_hash and prev[2] is None:
+                result.unchanged += 1
+                unchanged_ids.append(lid)
+                continue
+            else:
+                result.changed += 1
+                first_seen = prev[1] or now
+                if prev[2] is not None:
+                    events.append([lid, l.source, "relisted", prev[3], l.price, now])
+                if prev[3] is not None and l.price is not None and prev[3] != l.price:
+                    events.append([lid, l.source, "price_change", prev[3], l.price, now])
+            result.changed_ids.append(lid)
+            # Promote at write time: loaded rows get a LazyPayload that readers don't parse
+            promoted = listing_promoted_fields(l)
+            rows.append(
+                [
+                    l.id,
+                    l.source,
+                    l.address,
+                    l.city,
+                    l.province,
+                    l.postal_code,
+                    l.price,
+                    l.bedrooms,
+                    l.bathrooms,
+                    l.property_type,
+                    l.description,
+                    l.url,
+                    plain_payload(l.raw_payload),
+                    l.fetched_at,
+                    promoted["hoa_dues"],
+                    promoted["property_type_code"],
+                    promoted["lot_size_sqft"],
+                    listing_search_text(l),
+                    content_hash,
+                    first_seen,
+                    now,
+                    now,
+                    None,
+                ]
+            )
+
+        bulk_upsert(conn, "listings_raw", _LISTING_WRITE_COLUMNS, rows)
+        if unchanged_ids:
+            stage_rows(conn, "_unchanged_ids", {"id": "TEXT"}, [[lid] for lid in unchanged_ids])
+            conn.execute(
+                "UPDATE listings_raw SET last_seen_at = ? WHERE id IN (SELECT id FROM _unchanged_ids)",
+                [now],
+            )
+            conn.execute("DROP TABLE _unchanged_ids")
+        if complete and any(complete.values()):
+            seen = set(incoming) | (seen_ids or set())
+            stage_rows(conn, "_seen_ids", {"id": "TEXT"}, [[lid] for lid in seen])
+            for source, cities in complete.items():
+                if not cities:
+                    continue
+                removed = conn.execute(
+                    """
+                    UPDATE listings_raw SET removed_at = ?
+                    WHERE removed_at IS NULL
+                      AND source = ?
+                      AND list_contains(?, lower(city))
+                      AND id NOT IN (SELECT id FROM _seen_ids)
+                    RETURNING id, price
+                    """,
+                    [now, source, [c.lower() for c in cities]],
+                ).fetchall()
+                result.removed += len(removed)
+                events.extend([lid, source, "delisted", price, None, now] for lid, price in removed)
+            conn.execute("DROP TABLE _seen_ids")
+        bulk_upsert(conn, "listing_events", _EVENT_COLUMNS, events, replace=False)
+        return result
+
+    def load_changed_ids(self, since: datetime) -> list[str]:
+        """Ids of active listings first seen or changed at/after *since*."""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT id FROM listings_raw WHERE changed_at >= ? AND removed_at IS NULL ORDER BY id",
+            [since],
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def load_listing_events(
+        self,
+        listing_id: str | None = None,
+        event_type: str | None = None,
+        since: datetime | None = None,
+    ) -> list[dict[str, Any]]:
+        """Listing history rows (oldest first), optionally for one listing / event type / since a time."""
+        conn = self._connect()
+        where: list[str] = []
+        params: list[Any] = []
+        if listing_id is not None:
+            where.append("listing_id = ?")
+            params.append(listing_id)
+        if event_type is not None:
+            where.append("event_type = ?")
+            params.append(event_type)
+        if since is not None:
+            where.append("occurred_at >= ?")
+            params.append(since)
+        sql = "SELECT listing_id, source, event_type, old_price, new_price, occurred_at FROM listing_events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        rows = conn.execute(sql + " ORDER BY occurred_at, listing_id", params).fetchall()
+        cols = ["listing_id", "source", "event_type", "old_price", "new_price", "occurred_at"]
+        return [dict(zip(cols, row)) for row in rows]
+
+    def days_on_market(self, listing_ids: list[str] | None = None) -> dict[str, float]:
+        """
+        Days each listing has been on the market: first seen until delisted, or until now.
+
+        Gaps while a listing was delisted are not subtracted (relists keep their history).
+        """
+        conn = self._connect()
+        sql = """
+            SELECT id, date_diff('second', first_seen_at, coalesce(removed_at, ?)) / 86400.0
+            FROM listings_raw WHERE first_seen_at IS NOT NULL
+        """
+        params: list[Any] = [datetime.utcnow()]
+        if listing_ids is not None:
+            sql += " AND list_contains(?, id)"
+            params.append(list(listing_ids))
+        return {lid: float(days) for lid, days in conn.execute(sql, params).fetchall()}
+
+    def price_cut_stats(self, since: datetime | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Per-listing price cuts from listing_events (only listings with at least one cut).
+
+        Each entry has ``cuts``, ``total_cut`` (dollars), ``total_cut_pct`` (vs the
+        price before the first cut), ``last_cut_at`` and ``cuts_per_30d`` measured
+        over the listing's days on market.
+        """
+        conn = self._connect()
+        sql = """
+            SELECT e.listing_id,
+                   count(*) AS cuts,
+                   sum(e.old_price - e.new_price) AS total_cut,
+                   arg_min(e.old_price, e.occurred_at) AS start_price,
+                   max(e.occurred_at) AS last_cut_at,
+                   date_diff('second', any_value(r.first_seen_at), coalesce(any_value(r.removed_at), ?)) / 86400.0 AS dom
+            FROM listing_events e
+            JOIN listings_raw r ON r.id = e.listing_id
+            WHERE e.event_type = 'price_change' AND e.new_price < e.old_price
+        """
+        params: list[Any] = [datetime.utcnow()]
+        if since is not None:
+            sql += " AND e.occurred_at >= ?"
+            params.append(since)
+        sql += " GROUP BY e.listing_id"
+        stats: dict[str, dict[str, Any]] = {}
+        for lid, cuts, total_cut, start_price, last_cut_at, dom in conn.execute(sql, params).fetchall():
+            stats[lid] = {
+                "cuts": int(cuts),
+                "total_cut": float(total_cut),
+                "total_cut_pct": float(total_cut) / start_price if start_price else 0.0,
+                "last_cut_at": last_cut_at,
+                "cuts_per_30d": int(cuts) * 30.0 / max(float(dom or 0.0), 1.0),
+            }
+        return stats
 
     def save_deals(self, run_id: str, results: list[UnderwritingResult]) -> None:
-        """Save underwriting results to deals_underwritten."""
+        """
+        Save underwriting results to deals_underwritten.
+
+        Results carried forward from an earlier run (``carried_from_run`` set) are
+        stored by reference: their metric and pass/fail columns are written, but
+        ``full_result`` stays NULL and is read from the referenced run's row.
+        """
         if not results:
             return
         conn = self._connect()
@@ -153,56 +506,167 @@ class Storage:
                 r.stress_cashflow_monthly,
                 r.margin_of_safety_score,
                 1 if r.passed else 0,
-                json.dumps(r.reason_flags),
-                json.dumps(r.to_dict(), default=_serialize_datetime),
+                r.reason_flags,
+                None if r.carried_from_run not in (None, run_id) else r.to_dict(),
                 now,
+                r.input_hash,
+                r.config_fingerprint,
+                r.thresholds_fingerprint,
+                r.carried_from_run if r.carried_from_run != run_id else None,
             ]
             for r in results
         ]
-        conn.executemany(
-            """
-            INSERT OR REPLACE INTO deals_underwritten
-            (run_id, listing_id, rent_monthly, noi_annual, cashflow_monthly,
-             cap_rate, cash_on_cash, dscr, stress_cashflow_monthly,
-             margin_of_safety_score, passed, reason_flags, full_result, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            rows,
-        )
+        bulk_upsert(conn, "deals_underwritten", _DEAL_COLUMNS, rows)
 
-    def load_listings(self) -> list[Listing]:
-        """Load all listings from listings_raw."""
+    def load_prior_deals(self) -> dict[str, PriorDeal]:
+        """
+        Results of the latest underwriting run by listing id, resolved to the row
+        holding ``full_result`` (for :meth:`UnderwritingEngine.underwrite_incremental`).
+        """
         conn = self._connect()
-        rel = conn.execute("SELECT * FROM listings_raw")
-        rows = rel.fetchall()
-        cols = ["id", "source", "address", "city", "province", "postal_code", "price",
-                "bedrooms", "bathrooms", "property_type", "description", "url",
-                "raw_payload", "fetched_at"]
-        listings = []
-        for row in rows:
-            d = dict(zip(cols, row))
-            raw = d.get("raw_payload")
-            if isinstance(raw, str):
-                raw = json.loads(raw)
-            listings.append(
-                Listing(
-                    id=d["id"],
-                    source=d["source"],
-                    address=d["address"],
-                    city=d["city"],
-                    province=d["province"],
-                    postal_code=d["postal_code"],
-                    price=d["price"],
-                    bedrooms=d["bedrooms"],
-                    bathrooms=d["bathrooms"],
-                    property_type=d["property_type"],
-                    description=d["description"],
-                    url=d["url"],
-                    raw_payload=raw or {},
-                    fetched_at=d.get("fetched_at") or datetime.utcnow(),
-                )
-            )
-        return listings
+        rows = conn.execute("""
+            SELECT d.listing_id, src.run_id, src.input_hash, src.config_fingerprint,
+                   src.thresholds_fingerprint, src.full_result
+            FROM deals_underwritten d
+            JOIN deals_underwritten src
+              ON src.run_id = coalesce(d.carried_from_run, d.run_id) AND src.listing_id = d.listing_id
+            WHERE d.run_id = (SELECT max(run_id) FROM deals_underwritten)
+              AND src.full_result IS NOT NULL
+        """).fetchall()
+        return {
+            lid: PriorDeal(run_id, input_hash, config_fp, thresholds_fp, json.loads(full_result))
+            for lid, run_id, input_hash, config_fp, thresholds_fp, full_result in rows
+        }
+
+    @staticmethod
+    def _backfill_search_text(conn: duckdb.DuckDBPyConnection) -> None:
+        """Compute search_text for rows stored before the column existed (schema migration)."""
+        rows = conn.execute(
+            "SELECT id, address, property_type, description, raw_payload FROM listings_raw WHERE search_text IS NULL"
+        ).fetchall()
+        if not rows:
+            return
+        staged = [
+            [lid, listing_search_text(_row_to_listing({
+                "id": lid, "address": address, "property_type": ptype,
+                "description": desc, "raw_payload": raw,
+            }))]
+            for lid, address, ptype, desc, raw in rows
+        ]
+        stage_rows(conn, "_search_text", {"id": "TEXT", "search_text": "TEXT"}, staged)
+        conn.execute("""
+            UPDATE listings_raw SET search_text = s.search_text
+            FROM _search_text s WHERE listings_raw.id = s.id
+        """)
+        conn.execute("DROP TABLE _search_text")
+
+    def _listing_filters(
+        self,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        cities: list[str] | None = None,
+        sources: list[str] | None = None,
+        changed_since: datetime | None = None,
+        include_removed: bool = True,
+        include_keywords: list[str] | None = None,
+        exclude_keywords: list[str] | None = None,
+    ) -> tuple[str, list[Any]]:
+        """
+        WHERE clause (or "") and parameters for the listing loaders' predicates.
+
+        Keywords match as lowercase substrings of ``search_text``, like
+        :func:`~real_deal.filters.filter_listings`: at least one include
+        keyword (when any are given) and no exclude keyword.
+        """
+        where: list[str] = []
+        params: list[Any] = []
+        include = [kw.lower() for kw in include_keywords or [] if kw]
+        exclude = [kw.lower() for kw in exclude_keywords or [] if kw]
+        if include:
+            where.append("(" + " OR ".join(["contains(search_text, ?)"] * len(include)) + ")")
+            params.extend(include)
+        if exclude:
+            where.append("NOT (" + " OR ".join(["contains(search_text, ?)"] * len(exclude)) + ")")
+            params.extend(exclude)
+        if min_price is not None:
+            where.append("price >= ?")
+            params.append(min_price)
+        if max_price is not None:
+            where.append("price <= ?")
+            params.append(max_price)
+        if cities:
+            where.append("list_contains(?, lower(city))")
+            params.append([c.lower() for c in cities])
+        if sources:
+            where.append("list_contains(?, source)")
+            params.append(list(sources))
+        if changed_since is not None:
+            where.append("changed_at >= ?")
+            params.append(changed_since)
+        if not include_removed:
+            where.append("removed_at IS NULL")
+        return (" WHERE " + " AND ".join(where) if where else ""), params
+
+    def load_listing_columns(self, columns: list[str], **filters: Any) -> dict[str, list[Any]]:
+        """
+        Columnar batch: ``{column: [values...]}`` for just *columns* of matching rows.
+
+        *filters* are the predicates of :meth:`iter_listings`. JSON columns come back as text.
+        """
+        unknown = set(columns) - set(_LISTING_WRITE_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown listings_raw columns: {sorted(unknown)}")
+        conn = self._connect()
+        where, params = self._listing_filters(**filters)
+        rows = conn.execute(f"SELECT {', '.join(columns)} FROM listings_raw{where}", params).fetchall()
+        values = list(zip(*rows)) if rows else [() for _ in columns]
+        return {col: list(vals) for col, vals in zip(columns, values)}
+
+    def iter_listings(
+        self,
+        columns: list[str] | None = None,
+        min_price: float | None = None,
+        max_price: float | None = None,
+        cities: list[str] | None = None,
+        sources: list[str] | None = None,
+        changed_since: datetime | None = None,
+        include_removed: bool = True,
+        include_keywords: list[str] | None = None,
+        exclude_keywords: list[str] | None = None,
+        batch_size: int = 5000,
+    ) -> Iterator[Listing]:
+        """
+        Stream listings matching the predicates, *batch_size* rows at a time.
+
+        Filters (price band, cities, sources, changed-since, active only,
+        include/exclude keywords) run in DuckDB. With *columns*, only those
+        fields are read (``id`` is always included); the other Listing fields
+        get empty defaults.
+        """
+        cols = list(_LISTING_COLUMNS) if columns is None else ["id"] + [c for c in columns if c != "id"]
+        unknown = set(cols) - set(_LISTING_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown listing columns: {sorted(unknown)}")
+        conn = self._connect()
+        where, params = self._listing_filters(
+            min_price, max_price, cities, sources, changed_since, include_removed,
+            include_keywords, exclude_keywords,
+        )
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"SELECT {', '.join(cols)} FROM listings_raw{where}", params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield _row_to_listing(dict(zip(cols, row)))
+        finally:
+            cursor.close()
+
+    def load_listings(self, columns: list[str] | None = None, **filters: Any) -> list[Listing]:
+        """Load listings from listings_raw; see :meth:`iter_listings` for projection and predicates."""
+        return list(self.iter_listings(columns, **filters))
 
     def save_land_deals(self, run_id: str, results: list[Any]) -> None:
         """Save land underwriting results to land_underwritten."""
@@ -233,7 +697,7 @@ class Storage:
                         s.exit_strategy_score,
                         d.get("ai_summary", ""),
                         d.get("recommendation", ""),
-                        json.dumps(d, default=_serialize_datetime),
+                        d,
                         now,
                     ]
                 )
@@ -253,20 +717,56 @@ class Storage:
                         d.get("exit_strategy_score"),
                         d.get("ai_summary"),
                         d.get("recommendation"),
-                        json.dumps(d, default=_serialize_datetime),
+                        d,
                         now,
                     ]
                 )
+        bulk_upsert(conn, "land_underwritten", _LAND_DEAL_COLUMNS, rows)
+
+    def load_signal_cache(self, version: int) -> dict[tuple[str, str], dict[str, Any]]:
+        """Stored description signals for extractor *version*, keyed by (description hash, fields hash)."""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT description_hash, fields_hash, signals FROM signal_cache WHERE extractor_version = ?",
+            [version],
+        ).fetchall()
+        return {(d, f): json.loads(sig) for d, f, sig in rows}
+
+    def save_signal_cache(self, version: int, entries: dict[tuple[str, str], dict[str, Any]]) -> None:
+        """Upsert description signals for *version* and drop rows from other extractor versions."""
+        conn = self._connect()
+        conn.execute("DELETE FROM signal_cache WHERE extractor_version <> ?", [version])
+        if not entries:
+            return
+        now = datetime.utcnow()
+        rows = [[d, f, version, sig, now] for (d, f), sig in entries.items()]
+        bulk_upsert(conn, "signal_cache", _SIGNAL_CACHE_COLUMNS, rows)
+
+    def load_region_ids(self, max_age_days: float | None = None) -> dict[tuple[str, str], str]:
+        """Load cached Redfin regionIds keyed by (city, province); skip rows older than max_age_days."""
+        conn = self._connect()
+        if max_age_days is None:
+            rows = conn.execute("SELECT city, province, region_id FROM redfin_regions").fetchall()
+        else:
+            cutoff = datetime.utcnow() - timedelta(days=max_age_days)
+            rows = conn.execute(
+                "SELECT city, province, region_id FROM redfin_regions WHERE resolved_at >= ?",
+                [cutoff],
+            ).fetchall()
+        return {(city, province): region_id for city, province, region_id in rows}
+
+    def save_region_ids(self, region_ids: dict[tuple[str, str], str]) -> None:
+        """Upsert Redfin regionIds keyed by (city, province)."""
+        if not region_ids:
+            return
+        conn = self._connect()
+        now = datetime.utcnow()
         conn.executemany(
             """
-            INSERT OR REPLACE INTO land_underwritten
-            (run_id, listing_id, underwriting_score, buildability_score, servicing_score,
-             environmental_risk, estimated_servicing_cost, estimated_all_in_basis,
-             estimated_roi, land_type, exit_strategy_score, ai_summary, recommendation,
-             full_result, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT OR REPLACE INTO redfin_regions (city, province, region_id, resolved_at)
+            VALUES (?, ?, ?, ?)
             """,
-            rows,
+            [[city, province, rid, now] for (city, province), rid in region_ids.items()],
         )
 
     def close(self) -> None:
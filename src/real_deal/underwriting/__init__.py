@@ -1,11 +1,13 @@
 """Underwriting engine for cash-flow analysis."""
 
+from .cache import SignalCache
 from .engine import UnderwritingEngine
 from .rent import estimate_rent, estimate_rent_with_details, parse_rent_from_description, parse_rent_details
 from .signals import extract_signals, compute_confidence_score, ListingSignals, signals_to_dict
 
 __all__ = [
     "UnderwritingEngine",
+    "SignalCache",
     "estimate_rent",
     "estimate_rent_with_details",
     "parse_rent_from_description",
@@ -0,0 +1,153 @@
+"""Vectorised (NumPy) cash-flow metrics for batches of listings."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Sequence
+
+from ..models import PassFailThresholds, StressTestParams, UnderwritingAssumptions
+
+# Below this many listings the array setup costs more than the scalar loop
+BATCH_MIN_LISTINGS = 64
+
+
+def numpy_available() -> bool:
+    """True when the optional ``numpy`` package is installed (vectorised batch path)."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _amortisation(rate: float, amort_years: int) -> tuple[float, float, int]:
+    """``(r * (1 + r) ** n, (1 + r) ** n - 1, n)`` for one annual rate, computed once per tier."""
+    n = amort_years * 12
+    r = rate / 12
+    growth = (1 + r) ** n
+    return r * growth, growth - 1, n
+
+
+def underwrite_arrays(
+    price: Sequence[float],
+    rent: Sequence[float],
+    condo_fee: Sequence[float],
+    utilities: Sequence[float],
+    tier: Sequence[int],
+    tiers: Sequence[UnderwritingAssumptions],
+    stress: StressTestParams,
+    thresholds: PassFailThresholds,
+    cmhc_premium_rate: Callable[[float], float],
+) -> dict[str, list[Any]]:
+    """
+    Base/stress metrics for many listings in one pass.
+
+    *tier* indexes into *tiers* (the distinct assumption sets); amortisation
+    factors are derived once per tier. Every value follows the same operation
+    order as the scalar ``UnderwritingEngine`` methods, so results are
+    bit-identical (ratios with a non-positive denominator are int ``0`` there
+    too). Returns Python lists keyed by metric name.
+    """
+    import numpy as np
+
+    price_a = np.asarray(price, dtype=np.float64)
+    rent_a = np.asarray(rent, dtype=np.float64)
+    condo_annual = np.asarray(condo_fee, dtype=np.float64) * 12
+    utils_annual = np.asarray(utilities, dtype=np.float64) * 12
+    idx = np.asarray(tier, dtype=np.intp)
+
+    def per_tier(fn: Callable[[UnderwritingAssumptions], float]) -> Any:
+        return np.array([fn(uw) for uw in tiers], dtype=np.float64)[idx]
+
+    def pi_vectors(rate_fn: Callable[[UnderwritingAssumptions], float]) -> tuple[Any, Any, Any, Any]:
+        factors = [_amortisation(rate_fn(uw), uw.amort_years) for uw in tiers]
+        rg = np.array([f[0] for f in factors], dtype=np.float64)[idx]
+        gm1 = np.array([f[1] for f in factors], dtype=np.float64)[idx]
+        n = np.array([f[2] for f in factors], dtype=np.float64)[idx]
+        zero = np.array([rate_fn(uw) / 12 == 0 for uw in tiers], dtype=bool)[idx]
+        return rg, gm1, n, zero
+
+    down = price_a * per_tier(lambda uw: uw.down_payment_rate)
+    principal = (price_a - down) * per_tier(lambda uw: 1 + cmhc_premium_rate(uw.down_payment_rate))
+    closing = price_a * per_tier(lambda uw: uw.closing_cost_rate)
+    total_in = down + closing
+    prop_tax = price_a * per_tier(lambda uw: uw.property_tax_rate_annual)
+    insurance = per_tier(lambda uw: uw.insurance_monthly * 12)
+    snow_lawn = per_tier(lambda uw: uw.snow_lawn_monthly * 12)
+    mgmt_rate = per_tier(lambda uw: uw.management_rate)
+
+    def noi(rent_m: Any, vacancy_keep: Any, maint_rate: Any, capex_rate: Any) -> Any:
+        egi = rent_m * 12 * vacancy_keep
+        return (
+            egi - egi * mgmt_rate - egi * maint_rate - egi * capex_rate
+            - prop_tax - insurance - utils_annual - snow_lawn - condo_annual
+        )
+
+    def monthly_pi(rate_fn: Callable[[UnderwritingAssumptions], float]) -> Any:
+        rg, gm1, n, zero = pi_vectors(rate_fn)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(zero, principal / n, principal * rg / gm1)
+
+    def ratio(num: Any, den: Any) -> tuple[Any, list[Any]]:
+        ok = den > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            q = np.where(ok, num / den, 0.0)
+        return q, [v if k else 0 for v, k in zip(q.tolist(), ok.tolist())]
+
+    base_noi = noi(
+        rent_a,
+        per_tier(lambda uw: 1 - uw.vacancy_rate),
+        per_tier(lambda uw: uw.maintenance_rate),
+        per_tier(lambda uw: uw.capex_rate),
+    )
+    base_pi = monthly_pi(lambda uw: uw.interest_rate)
+    cashflow = base_noi / 12 - base_pi
+    _, cap_rate = ratio(base_noi, price_a)
+    coc, coc_list = ratio((base_noi / 12 - base_pi) * 12, total_in)
+    dscr, dscr_list = ratio(base_noi, base_pi * 12)
+
+    stress_rent = rent_a * (1 - stress.rent_haircut)
+    stress_noi = noi(
+        stress_rent,
+        per_tier(lambda uw: 1 - (uw.vacancy_rate + stress.vacancy_bump)),
+        per_tier(lambda uw: uw.maintenance_rate + stress.maintenance_bump),
+        per_tier(lambda uw: uw.capex_rate + stress.capex_bump),
+    )
+    stress_pi = monthly_pi(lambda uw: uw.interest_rate + stress.interest_rate_bump)
+    stress_cashflow = stress_noi / 12 - stress_pi
+    stress_dscr, stress_dscr_list = ratio(stress_noi, stress_pi * 12)
+
+    # Margin of safety: same increments as the scalar path; min(dscr, stress) only when stress is set
+    t = thresholds
+    has_stress = stress_dscr != 0
+    conservative = np.where(has_stress & (stress_dscr < dscr), stress_dscr, dscr)
+    score = (
+        t.margin_of_safety_base
+        + np.where(stress_cashflow > 0, t.margin_of_safety_stress_positive, 0.0)
+        + np.where(stress_cashflow >= t.min_cashflow_monthly, t.margin_of_safety_stress_threshold, 0.0)
+        + np.where(coc >= t.min_cash_on_cash, t.margin_of_safety_coc, 0.0)
+        + np.where(conservative >= t.min_dscr, t.margin_of_safety_dscr, 0.0)
+    )
+    # min(100, max(0, score)) returns the int bound at or beyond either edge (and for NaN)
+    mos = [s if 0 < s < 100 else (100 if s >= 100 else 0) for s in score.tolist()]
+
+    passed = (
+        (cashflow >= t.min_cashflow_monthly)
+        & (stress_cashflow >= 0)
+        & (coc >= t.min_cash_on_cash)
+        & (dscr >= t.min_dscr)
+    )
+    if t.require_stress_dscr:
+        passed &= ~has_stress | (stress_dscr >= t.min_dscr)
+
+    return {
+        "noi": base_noi.tolist(),
+        "cashflow": cashflow.tolist(),
+        "cap_rate": cap_rate,
+        "cash_on_cash": coc_list,
+        "dscr": dscr_list,
+        "stress_rent": stress_rent.tolist(),
+        "stress_cashflow": stress_cashflow.tolist(),
+        "stress_dscr": stress_dscr_list,
+        "margin_of_safety": mos,
+        "passed": passed.tolist(),
+    }
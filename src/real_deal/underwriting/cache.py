@@ -0,0 +1,129 @@
+"""Memoised description signals, persisted in DuckDB across underwriting runs."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+from ..listing_utils import listing_hoa_dues
+from ..models import Listing
+from .rent import RentScan, scan_quality_keywords, scan_rent_candidates
+from .signals import ListingSignals, extract_signals
+
+if TYPE_CHECKING:
+    from ..storage import Storage
+
+# Bump whenever extract_signals, the rent scan or the quality keywords change
+# behaviour: rows from other versions are ignored (and pruned on save).
+SIGNAL_EXTRACTOR_VERSION = 1
+
+
+@dataclass(frozen=True)
+class DescriptionSignals:
+    """Everything underwriting derives from a description by regex/keyword matching."""
+
+    signals: ListingSignals
+    rent_scan: RentScan
+    quality_hits: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "signals": asdict(self.signals),
+            "rent_candidates": [list(c) for c in self.rent_scan.candidates],
+            "rent_multi_unit": self.rent_scan.multi_unit,
+            "quality_hits": list(self.quality_hits),
+        }
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> DescriptionSignals:
+        return cls(
+            signals=ListingSignals(**d["signals"]),
+            rent_scan=RentScan(
+                tuple((float(a), bool(r), bool(t)) for a, r, t in d["rent_candidates"]),
+                bool(d["rent_multi_unit"]),
+            ),
+            quality_hits=tuple(d["quality_hits"]),
+        )
+
+
+def extract_description_signals(description: str | None, hoa_dues: float | None = None) -> DescriptionSignals:
+    """Run every description scan once (uncached)."""
+    return DescriptionSignals(
+        signals=extract_signals(description, hoa_dues=hoa_dues),
+        rent_scan=scan_rent_candidates(description),
+        quality_hits=scan_quality_keywords(description),
+    )
+
+
+def signal_cache_key(description: str | None, hoa_dues: float | None = None) -> tuple[str, str]:
+    """(description hash, payload-fields hash) for a listing's signal inputs."""
+    desc_hash = hashlib.sha256((description or "").encode()).hexdigest()[:32]
+    fields_hash = hashlib.sha256(repr(hoa_dues).encode()).hexdigest()[:16]
+    return desc_hash, fields_hash
+
+
+class SignalCache:
+    """
+    Description signals keyed by ``(description hash, payload-fields hash)``.
+
+    Listings that share text (re-scans, cross-source duplicates, boilerplate)
+    are scanned once; :meth:`load` / :meth:`save` persist entries in DuckDB so
+    re-underwriting after a config change skips the regex work entirely.
+    Entries computed since the last :meth:`take_new` are tracked for saving.
+    """
+
+    def __init__(
+        self,
+        entries: dict[tuple[str, str], DescriptionSignals] | None = None,
+        version: int = SIGNAL_EXTRACTOR_VERSION,
+    ) -> None:
+        self.version = version
+        self._entries = dict(entries or {})
+        self._new: dict[tuple[str, str], DescriptionSignals] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, listing: Listing) -> DescriptionSignals:
+        """Signals for *listing*, computed and remembered on a miss."""
+        hoa_dues = listing_hoa_dues(listing)
+        key = signal_cache_key(listing.description, hoa_dues)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = extract_description_signals(listing.description, hoa_dues)
+        self._entries[key] = entry
+        self._new[key] = entry
+        return entry
+
+    def take_new(self) -> dict[tuple[str, str], DescriptionSignals]:
+        """Entries computed since the last call (e.g. to ship back from a worker)."""
+        new, self._new = self._new, {}
+        return new
+
+    def update(self, entries: dict[tuple[str, str], DescriptionSignals]) -> None:
+        """Add entries computed elsewhere (they are saved by the next :meth:`save`)."""
+        for key, entry in entries.items():
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._new[key] = entry
+
+    @classmethod
+    def load(cls, storage: Storage, version: int = SIGNAL_EXTRACTOR_VERSION) -> SignalCache:
+        """Cache pre-filled with the stored entries for *version*."""
+        rows = storage.load_signal_cache(version)
+        return cls(
+            {key: DescriptionSignals.from_dict(d) for key, d in rows.items()},
+            version=version,
+        )
+
+    def save(self, storage: Storage) -> int:
+        """Persist new entries; returns how many were written."""
+        new = self.take_new()
+        storage.save_signal_cache(self.version, {key: e.to_dict() for key, e in new.items()})
+        return len(new)
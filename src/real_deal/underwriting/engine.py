@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import List
+import hashlib
+import json
+from dataclasses import asdict, dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Callable, List
 
 from ..models import (
     Listing,
@@ -12,18 +15,41 @@ from ..models import (
     UnderwritingAssumptions,
     UnderwritingResult,
 )
+from ..listing_utils import listing_hoa_dues, underwriting_input_hash
+from .cache import SIGNAL_EXTRACTOR_VERSION, SignalCache
+from .batch import BATCH_MIN_LISTINGS, numpy_available, underwrite_arrays
 from .rent import estimate_rent_with_details
-from .signals import extract_signals, compute_confidence_score, signals_to_dict
+from .signals import ListingSignals, extract_signals, compute_confidence_score, signals_to_dict
 from ..config import (
     _build_city_to_tier,
     get_pass_fail_thresholds,
-    get_rent_estimation_params_for_city,
+    get_rent_estimation_params_for_tier,
     get_stress_params,
     get_underwriting_assumptions,
-    get_underwriting_assumptions_for_city,
+    get_underwriting_assumptions_for_tier,
     load_config,
 )
 
+if TYPE_CHECKING:
+    from ..storage import PriorDeal
+
+
+def _fingerprint(section: dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(section, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+@dataclass(slots=True)
+class _ListingInputs:
+    """Per-listing inputs to the cash-flow math (after signal and rent extraction)."""
+
+    listing: Listing
+    assumptions: UnderwritingAssumptions
+    signals: ListingSignals
+    rent_monthly: float
+    rent_meta: dict[str, Any]
+    condo_fee: float
+    utilities_monthly: float
+
 
 class UnderwritingEngine:
     """
@@ -41,6 +67,7 @@ class UnderwritingEngine:
         thresholds: PassFailThresholds | None = None,
         rent_params: dict | None = None,
         config: dict | None = None,
+        signal_cache: SignalCache | None = None,
     ) -> None:
         cfg = config or load_config()
         self._config = cfg
@@ -49,48 +76,50 @@ class UnderwritingEngine:
         self.stress_params = stress_params or get_stress_params(cfg)
         self.thresholds = thresholds or get_pass_fail_thresholds(cfg)
         self._rent_params_override = rent_params
+        self.signal_cache = signal_cache
+        self._tier_params = self._resolve_tier_params()
+        self._tier_fingerprints = {
+            tier: _fingerprint(
+                {
+                    "assumptions": asdict(uw),
+                    "rent": asdict(rent_p),
+                    "stress": asdict(self.stress_params),
+                    "signal_extractor": SIGNAL_EXTRACTOR_VERSION,
+                }
+            )
+            for tier, (uw, rent_p) in self._tier_params.items()
+        }
+        self.thresholds_fingerprint = _fingerprint(asdict(self.thresholds))
+
+    def _resolve_tier_params(
+        self,
+    ) -> dict[str | None, tuple[UnderwritingAssumptions, RentEstimationParams]]:
+        """Assumptions and rent params per city tier (``None`` = untiered cities), resolved once."""
+        override = self._rent_params_override or {}
+        rent_fields = {f.name for f in fields(RentEstimationParams)}
+        table = {}
+        for tier in [None, *sorted(set(self._city_to_tier.values()))]:
+            rent_p = get_rent_estimation_params_for_tier(self._config, tier)
+            if override:
+                rent_p = replace(rent_p, **{k: v for k, v in override.items() if k in rent_fields})
+            table[tier] = (get_underwriting_assumptions_for_tier(self._config, tier), rent_p)
+        return table
+
+    def _params_for_city(self, city: str) -> tuple[UnderwritingAssumptions, RentEstimationParams]:
+        """Cached (assumptions, rent params) for *city*'s tier."""
+        return self._tier_params[self._city_to_tier.get((city or "").strip().lower())]
+
+    def config_fingerprint(self, city: str) -> str:
+        """Hash of the config a result for *city* depends on (tier assumptions, rent, stress), thresholds aside."""
+        return self._tier_fingerprints[self._city_to_tier.get((city or "").strip().lower())]
 
     def underwrite(self, listing: Listing) -> UnderwritingResult:
         """Run full underwriting on a listing."""
-        assumptions = get_underwriting_assumptions_for_city(
-            self._config, listing.city, self._city_to_tier
-        )
-        rent_p = get_rent_estimation_params_for_city(
-            self._config, listing.city, self._city_to_tier
-        )
-        if self._rent_params_override:
-            o = self._rent_params_override
-            rent_p = RentEstimationParams(
-                base=o.get("base", rent_p.base),
-                per_bedroom=o.get("per_bedroom", rent_p.per_bedroom),
-                min_rent=o.get("min_rent", rent_p.min_rent),
-                max_rent=o.get("max_rent", rent_p.max_rent),
-                max_bedrooms_single_unit=o.get(
-                    "max_bedrooms_single_unit", rent_p.max_bedrooms_single_unit
-                ),
-                max_bedrooms_per_unit=o.get("max_bedrooms_per_unit", rent_p.max_bedrooms_per_unit),
-                sfh_base=o.get("sfh_base", rent_p.sfh_base),
-                sfh_per_bedroom=o.get("sfh_per_bedroom", rent_p.sfh_per_bedroom),
-                sfh_max_rent=o.get("sfh_max_rent", rent_p.sfh_max_rent),
-                sfh_max_bedrooms=o.get("sfh_max_bedrooms", rent_p.sfh_max_bedrooms),
-                sfh_price_tiers=o.get("sfh_price_tiers", rent_p.sfh_price_tiers),
-                sfh_quality_min_price=o.get("sfh_quality_min_price", rent_p.sfh_quality_min_price),
-                sfh_quality_bonus_per_hit=o.get(
-                    "sfh_quality_bonus_per_hit", rent_p.sfh_quality_bonus_per_hit
-                ),
-                sfh_quality_bonus_max=o.get("sfh_quality_bonus_max", rent_p.sfh_quality_bonus_max),
-            )
-
-        signals = extract_signals(listing.description, listing.raw_payload)
-        rent_monthly, rent_meta = estimate_rent_with_details(
-            listing,
-            rent_p,
-            unit_count_hint=signals.unit_count_hint,
-            multi_unit_signal=signals.multi_unit_signal,
-        )
-        rent_was_explicit = rent_meta.get("rent_was_explicit", False)
-        condo_fee = signals.condo_fee_monthly or 0.0
-        utilities_monthly = self._utilities_monthly(signals, assumptions)
+        inputs = self._prepare(listing)
+        assumptions = inputs.assumptions
+        rent_monthly = inputs.rent_monthly
+        condo_fee = inputs.condo_fee
+        utilities_monthly = inputs.utilities_monthly
 
         # Base case
         noi = self._noi(
@@ -139,7 +168,172 @@ class UnderwritingEngine:
         passed, flags = self._evaluate(
             listing, cashflow, stress_cashflow, coc, dscr, stress_dscr
         )
+        return self._result(
+            inputs,
+            noi=noi,
+            cashflow=cashflow,
+            cap_rate=cap_rate,
+            coc=coc,
+            dscr=dscr,
+            stress_rent=stress_rent,
+            stress_cashflow=stress_cashflow,
+            stress_dscr=stress_dscr,
+            mos=mos,
+            passed=passed,
+            flags=flags,
+        )
+
+    def underwrite_many(self, listings: List[Listing]) -> List[UnderwritingResult]:
+        """
+        Underwrite multiple listings.
+
+        Signals and rent are extracted per listing; the cash-flow metrics then run
+        as one vectorised NumPy pass when numpy is installed and the batch is large
+        enough (identical results to :meth:`underwrite`), else per listing.
+        """
+        if len(listings) < BATCH_MIN_LISTINGS or not numpy_available():
+            return [self.underwrite(l) for l in listings]
+
+        inputs = [self._prepare(l) for l in listings]
+        tiers: list[UnderwritingAssumptions] = []
+        tier_index: dict[int, int] = {}
+        tier = []
+        for item in inputs:
+            key = id(item.assumptions)  # shared per tier (see _resolve_tier_params)
+            if key not in tier_index:
+                tier_index[key] = len(tiers)
+                tiers.append(item.assumptions)
+            tier.append(tier_index[key])
 
+        m = underwrite_arrays(
+            price=[item.listing.price for item in inputs],
+            rent=[item.rent_monthly for item in inputs],
+            condo_fee=[item.condo_fee for item in inputs],
+            utilities=[item.utilities_monthly for item in inputs],
+            tier=tier,
+            tiers=tiers,
+            stress=self.stress_params,
+            thresholds=self.thresholds,
+            cmhc_premium_rate=self._cmhc_premium_rate,
+        )
+        return [
+            self._result(
+                item,
+                noi=m["noi"][i],
+                cashflow=m["cashflow"][i],
+                cap_rate=m["cap_rate"][i],
+                coc=m["cash_on_cash"][i],
+                dscr=m["dscr"][i],
+                stress_rent=m["stress_rent"][i],
+                stress_cashflow=m["stress_cashflow"][i],
+                stress_dscr=m["stress_dscr"][i],
+                mos=m["margin_of_safety"][i],
+                passed=m["passed"][i],
+                flags=self._reason_flags(
+                    m["cashflow"][i],
+                    m["stress_cashflow"][i],
+                    m["cash_on_cash"][i],
+                    m["dscr"][i],
+                    m["stress_dscr"][i],
+                ),
+            )
+            for i, item in enumerate(inputs)
+        ]
+
+    def underwrite_incremental(
+        self,
+        listings: List[Listing],
+        prior: dict[str, PriorDeal],
+        compute: Callable[[List[Listing]], List[UnderwritingResult]] | None = None,
+    ) -> List[UnderwritingResult]:
+        """
+        Underwrite *listings*, reusing *prior* results (by listing id) where possible.
+
+        A prior result is carried forward when the listing's underwriting inputs and
+        its config fingerprint are unchanged; if only the pass/fail thresholds
+        changed it is re-evaluated from the stored metrics. Everything else goes
+        through *compute* (default :meth:`underwrite_many`). Results keep input order.
+        """
+        carried: dict[int, UnderwritingResult] = {}
+        stale: list[Listing] = []
+        for i, listing in enumerate(listings):
+            result = self.carry_forward(listing, prior.get(listing.id))
+            if result is None:
+                stale.append(listing)
+            else:
+                carried[i] = result
+        computed = iter((compute or self.underwrite_many)(stale) if stale else [])
+        return [carried[i] if i in carried else next(computed) for i in range(len(listings))]
+
+    def carry_forward(self, listing: Listing, prior: PriorDeal | None) -> UnderwritingResult | None:
+        """*prior*'s result for *listing* if still valid under this engine's config, else None."""
+        if (
+            prior is None
+            or prior.input_hash != underwriting_input_hash(listing)
+            or prior.config_fingerprint != self.config_fingerprint(listing.city)
+        ):
+            return None
+        try:
+            result = UnderwritingResult.from_dict(prior.full_result, listing=listing)
+        except (KeyError, TypeError):
+            return None  # stored before every field was serialised
+        result.input_hash = prior.input_hash
+        result.config_fingerprint = prior.config_fingerprint
+        result.thresholds_fingerprint = prior.thresholds_fingerprint
+        result.carried_from_run = prior.run_id
+        if prior.thresholds_fingerprint != self.thresholds_fingerprint:
+            result.thresholds = self.thresholds
+            result.thresholds_fingerprint = self.thresholds_fingerprint
+            result.margin_of_safety_score = self._margin_of_safety(
+                result.cashflow_monthly,
+                result.stress_cashflow_monthly,
+                result.cash_on_cash,
+                result.dscr,
+                result.stress_dscr,
+            )
+            result.passed, result.reason_flags = self._evaluate(
+                listing,
+                result.cashflow_monthly,
+                result.stress_cashflow_monthly,
+                result.cash_on_cash,
+                result.dscr,
+                result.stress_dscr,
+            )
+        return result
+
+    def _prepare(self, listing: Listing) -> _ListingInputs:
+        """Resolve per-city parameters, extract signals and estimate rent for *listing*."""
+        assumptions, rent_p = self._params_for_city(listing.city)
+        if self.signal_cache is None:
+            signals = extract_signals(listing.description, hoa_dues=listing_hoa_dues(listing))
+            rent_scan = quality_hits = None
+        else:
+            cached = self.signal_cache.get(listing)
+            signals, rent_scan, quality_hits = cached.signals, cached.rent_scan, cached.quality_hits
+        rent_monthly, rent_meta = estimate_rent_with_details(
+            listing,
+            rent_p,
+            unit_count_hint=signals.unit_count_hint,
+            multi_unit_signal=signals.multi_unit_signal,
+            rent_scan=rent_scan,
+            quality_hits=quality_hits,
+        )
+        return _ListingInputs(
+            listing=listing,
+            assumptions=assumptions,
+            signals=signals,
+            rent_monthly=rent_monthly,
+            rent_meta=rent_meta,
+            condo_fee=signals.condo_fee_monthly or 0.0,
+            utilities_monthly=self._utilities_monthly(signals, assumptions),
+        )
+
+    def _result(self, inputs: _ListingInputs, **m) -> UnderwritingResult:
+        """Assemble the result (confidence, signals dict) from prepared inputs and metrics."""
+        listing = inputs.listing
+        signals = inputs.signals
+        rent_meta = inputs.rent_meta
+        rent_was_explicit = rent_meta.get("rent_was_explicit", False)
         confidence_score, confidence_notes = compute_confidence_score(
             listing, signals, rent_was_explicit
         )
@@ -148,35 +342,35 @@ class UnderwritingEngine:
         signals_dict.update(
             {k: v for k, v in rent_meta.items() if k != "rent_was_explicit"}
         )
-        if utilities_monthly == 0 and signals.tenant_pays_utilities:
+        if inputs.utilities_monthly == 0 and signals.tenant_pays_utilities:
             signals_dict["utilities_assumption"] = "tenant_pays"
 
         return UnderwritingResult(
             listing_id=listing.id,
             listing=listing,
-            rent_monthly=rent_monthly,
-            noi_annual=noi,
-            cashflow_monthly=cashflow,
-            cap_rate=cap_rate,
-            cash_on_cash=coc,
-            dscr=dscr,
-            stress_rent_monthly=stress_rent,
-            stress_cashflow_monthly=stress_cashflow,
-            margin_of_safety_score=mos,
-            passed=passed,
-            reason_flags=flags,
-            assumptions=assumptions,
+            rent_monthly=inputs.rent_monthly,
+            noi_annual=m["noi"],
+            cashflow_monthly=m["cashflow"],
+            cap_rate=m["cap_rate"],
+            cash_on_cash=m["coc"],
+            dscr=m["dscr"],
+            stress_rent_monthly=m["stress_rent"],
+            stress_cashflow_monthly=m["stress_cashflow"],
+            margin_of_safety_score=m["mos"],
+            passed=m["passed"],
+            reason_flags=m["flags"],
+            assumptions=inputs.assumptions,
             stress_params=self.stress_params,
             thresholds=self.thresholds,
             confidence_score=confidence_score,
             signals=signals_dict,
             confidence_notes=confidence_notes,
+            stress_dscr=m["stress_dscr"],
+            input_hash=underwriting_input_hash(listing),
+            config_fingerprint=self.config_fingerprint(listing.city),
+            thresholds_fingerprint=self.thresholds_fingerprint,
         )
 
-    def underwrite_many(self, listings: List[Listing]) -> List[UnderwritingResult]:
-        """Underwrite multiple listings."""
-        return [self.underwrite(l) for l in listings]
-
     @staticmethod
     def _utilities_monthly(signals, assumptions: UnderwritingAssumptions) -> float:
         """Landlord-paid utilities; zero when tenant pays."""
@@ -309,6 +503,27 @@ class UnderwritingEngine:
         stress_dscr: float = 0.0,
     ) -> tuple[bool, list[str]]:
         """Evaluate pass/fail and build reason flags."""
+        flags = self._reason_flags(cashflow, stress_cashflow, coc, dscr, stress_dscr)
+        passed = (
+            cashflow >= self.thresholds.min_cashflow_monthly
+            and stress_cashflow >= 0
+            and coc >= self.thresholds.min_cash_on_cash
+            and dscr >= self.thresholds.min_dscr
+        )
+        if self.thresholds.require_stress_dscr and stress_dscr:
+            passed = passed and stress_dscr >= self.thresholds.min_dscr
+
+        return passed, flags
+
+    def _reason_flags(
+        self,
+        cashflow: float,
+        stress_cashflow: float,
+        coc: float,
+        dscr: float,
+        stress_dscr: float = 0.0,
+    ) -> list[str]:
+        """PASS/FAIL reason flags for each threshold."""
         flags: list[str] = []
         if cashflow >= self.thresholds.min_cashflow_monthly:
             flags.append("PASS: cashflow")
@@ -340,13 +555,4 @@ class UnderwritingEngine:
                     f"FAIL: stress_DSCR {stress_dscr:.2f} < {self.thresholds.min_dscr:.2f}"
                 )
 
-        passed = (
-            cashflow >= self.thresholds.min_cashflow_monthly
-            and stress_cashflow >= 0
-            and coc >= self.thresholds.min_cash_on_cash
-            and dscr >= self.thresholds.min_dscr
-        )
-        if self.thresholds.require_stress_dscr and stress_dscr:
-            passed = passed and stress_dscr >= self.thresholds.min_dscr
-
-        return passed, flags
+        return flags
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass
 from typing import Optional
 
+from ..keywords import KeywordMatcher
 from ..models import Listing, RentEstimationParams
 
 # Context keywords that suggest a dollar amount is rent-related.
@@ -32,6 +34,10 @@ _MULTI_UNIT_SIGNALS: set[str] = {
 
 _CONTEXT_WINDOW = 40  # chars before + after a match to scan for keywords
 
+_RENT_MATCHER = KeywordMatcher(_RENT_KEYWORDS)
+_IGNORE_MATCHER = KeywordMatcher(_IGNORE_KEYWORDS)
+_MULTI_UNIT_MATCHER = KeywordMatcher(_MULTI_UNIT_SIGNALS)
+
 
 def _extract_candidates(text: str) -> list[tuple[float, int]]:
     """Extract (amount, position) pairs from *lowercased* text.
@@ -75,72 +81,78 @@ def _context_around(text: str, pos: int, window: int = _CONTEXT_WINDOW) -> str:
 
 def _is_rent_ish(context: str) -> bool:
     """Return True if *context* contains at least one rent keyword."""
-    return any(kw in context for kw in _RENT_KEYWORDS)
+    return _RENT_MATCHER.search_any(context)
 
 
 def _is_ignorable(context: str, amount_index: int | None = None) -> bool:
     """Return True if an ignore keyword appears before the amount in *context*."""
     if amount_index is None:
-        return any(kw in context for kw in _IGNORE_KEYWORDS)
-    left = context[:amount_index]
-    return any(kw in left for kw in _IGNORE_KEYWORDS)
+        return _IGNORE_MATCHER.search_any(context)
+    return _IGNORE_MATCHER.search_any(context[:amount_index])
 
 
 def _has_multi_unit_signal(text: str) -> bool:
     """Return True if the full description signals a multi-unit property."""
-    return any(sig in text for sig in _MULTI_UNIT_SIGNALS)
+    return _MULTI_UNIT_MATCHER.search_any(text)
 
 
-def parse_rent_details(
-    description: str,
+@dataclass(frozen=True)
+class RentScan:
+    """Config-independent result of scanning a description for rent amounts (the regex work).
+
+    ``candidates`` holds every ``(amount, rent_context, total_context)`` found, in text
+    order: ``rent_context`` means a rent keyword and no preceding ignore keyword in the
+    context window, ``total_context`` that the window mentions "total". Rent bounds are
+    applied afterwards, so one scan serves any ``min_rent``/``max_rent``.
+    """
+
+    candidates: tuple[tuple[float, bool, bool], ...] = ()
+    multi_unit: bool = False
+
+
+def scan_rent_candidates(description: str | None) -> RentScan:
+    """Scan *description* for rent candidates and multi-unit wording."""
+    if not description:
+        return RentScan()
+    text = description.lower()
+    candidates = []
+    for amt, pos in _extract_candidates(text):
+        start = max(0, pos - _CONTEXT_WINDOW)
+        ctx = _context_around(text, pos)
+        rent_context = not _is_ignorable(ctx, pos - start) and _is_rent_ish(ctx)
+        candidates.append((amt, rent_context, "total" in ctx))
+    return RentScan(tuple(candidates), _has_multi_unit_signal(text))
+
+
+def rent_from_scan(
+    scan: RentScan,
     min_rent: float = 500,
     max_rent: float = 15000,
 ) -> tuple[Optional[float], dict]:
-    """Parse explicit rent from a listing description with metadata.
-
-    Returns (rent, metadata) where metadata includes:
-    - rent_candidates_count: number of validated rent candidates
-    - multi_unit_sum_applied: True if multi-unit sum was used
-    - explicit_rent_found: True if rent was parsed (not None)
-    """
+    """Explicit rent and metadata from a :class:`RentScan` (see :func:`parse_rent_details`)."""
     metadata: dict = {
         "rent_candidates_count": 0,
         "multi_unit_sum_applied": False,
         "explicit_rent_found": False,
     }
-    if not description:
-        return None, metadata
-
-    text = description.lower()
-    raw_candidates = _extract_candidates(text)
 
     # Validate candidates ------------------------------------------------
-    validated: list[float] = []
-    for amt, pos in raw_candidates:
-        if not (min_rent <= amt <= max_rent):
-            continue
-        start = max(0, pos - _CONTEXT_WINDOW)
-        ctx = _context_around(text, pos)
-        amount_index = pos - start
-        if _is_ignorable(ctx, amount_index):
-            continue
-        if _is_rent_ish(ctx):
-            validated.append(amt)
+    validated: list[float] = [
+        amt for amt, rent_context, _ in scan.candidates if min_rent <= amt <= max_rent and rent_context
+    ]
 
     metadata["rent_candidates_count"] = len(validated)
     if not validated:
         return None, metadata
 
     # Multi-unit sum rule ------------------------------------------------
-    if _has_multi_unit_signal(text) and len(validated) >= 2:
+    if scan.multi_unit and len(validated) >= 2:
         totals: list[float] = []
         per_unit: list[float] = []
-        for amt, pos in raw_candidates:
+        for amt, _, total_context in scan.candidates:
             if amt not in validated:
                 continue
-            start = max(0, pos - _CONTEXT_WINDOW)
-            ctx = _context_around(text, pos)
-            if "total" in ctx:
+            if total_context:
                 totals.append(amt)
             elif 800 <= amt <= 8000:
                 per_unit.append(amt)
@@ -158,6 +170,21 @@ def parse_rent_details(
     return max(validated), metadata
 
 
+def parse_rent_details(
+    description: str,
+    min_rent: float = 500,
+    max_rent: float = 15000,
+) -> tuple[Optional[float], dict]:
+    """Parse explicit rent from a listing description with metadata.
+
+    Returns (rent, metadata) where metadata includes:
+    - rent_candidates_count: number of validated rent candidates
+    - multi_unit_sum_applied: True if multi-unit sum was used
+    - explicit_rent_found: True if rent was parsed (not None)
+    """
+    return rent_from_scan(scan_rent_candidates(description), min_rent, max_rent)
+
+
 def parse_rent_from_description(
     description: str,
     min_rent: float = 500,
@@ -285,6 +312,7 @@ _QUALITY_KEYWORDS: tuple[str, ...] = (
     "high-end",
     "designer",
 )
+_QUALITY_MATCHER = KeywordMatcher(_QUALITY_KEYWORDS)
 
 
 def _sfh_formula_params(
@@ -309,16 +337,24 @@ def _sfh_formula_params(
     return base, per_bedroom, max_rent, tier_label
 
 
+def scan_quality_keywords(description: str | None) -> tuple[str, ...]:
+    """Premium style/condition keywords in *description* (keyword-list order)."""
+    found = _QUALITY_MATCHER.hits((description or "").lower())
+    return tuple(kw for kw in _QUALITY_KEYWORDS if kw in found)
+
+
 def _quality_rent_bonus(
     description: str,
     price: float,
     params: RentEstimationParams,
+    quality_hits: tuple[str, ...] | None = None,
 ) -> tuple[float, list[str]]:
     """Small rent bump for premium style/condition keywords on higher-priced homes."""
     if params.sfh_quality_bonus_max <= 0 or price < params.sfh_quality_min_price:
         return 0.0, []
-    text = (description or "").lower()
-    hits = [kw for kw in _QUALITY_KEYWORDS if kw in text]
+    if quality_hits is None:
+        quality_hits = scan_quality_keywords(description)
+    hits = list(quality_hits)
     if not hits:
         return 0.0, []
     bonus = min(len(hits) * params.sfh_quality_bonus_per_hit, params.sfh_quality_bonus_max)
@@ -331,12 +367,13 @@ def _estimate_single_family_rent(
     meta: dict,
     price: float = 0.0,
     description: str = "",
+    quality_hits: tuple[str, ...] | None = None,
 ) -> float:
     """Whole-home rent for SFH listings; price tier and quality adjust the cap."""
     sfh_base, sfh_per_bedroom, sfh_max_rent, tier_label = _sfh_formula_params(params, price)
     effective_beds, capped = _capped_bedrooms(bedrooms, params.sfh_max_bedrooms)
     raw = sfh_base + sfh_per_bedroom * effective_beds
-    quality_bonus, quality_hits = _quality_rent_bonus(description, price, params)
+    quality_bonus, quality_hits = _quality_rent_bonus(description, price, params, quality_hits)
     rent = min(raw + quality_bonus, sfh_max_rent)
     meta["single_family_formula"] = True
     meta["effective_bedrooms"] = effective_beds
@@ -360,10 +397,18 @@ def estimate_rent_with_details(
     params: RentEstimationParams,
     unit_count_hint: int | None = None,
     multi_unit_signal: bool = False,
+    rent_scan: RentScan | None = None,
+    quality_hits: tuple[str, ...] | None = None,
 ) -> tuple[float, dict]:
-    """Estimate monthly rent with metadata (rent_was_explicit, etc.)."""
-    parsed, meta = parse_rent_details(
-        listing.description,
+    """Estimate monthly rent with metadata (rent_was_explicit, etc.).
+
+    *rent_scan* and *quality_hits* are precomputed description scans (see
+    ``underwriting.cache``); when omitted the description is scanned here.
+    """
+    if rent_scan is None:
+        rent_scan = scan_rent_candidates(listing.description)
+    parsed, meta = rent_from_scan(
+        rent_scan,
         min_rent=params.min_rent,
         max_rent=params.max_rent,
     )
@@ -381,5 +426,10 @@ def estimate_rent_with_details(
         return _estimate_income_property_rent(bedrooms, params, unit_count, meta), meta
 
     return _estimate_single_family_rent(
-        bedrooms, params, meta, price=listing.price, description=listing.description
+        bedrooms,
+        params,
+        meta,
+        price=listing.price,
+        description=listing.description,
+        quality_hits=quality_hits,
     ), meta
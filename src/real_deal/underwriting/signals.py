@@ -9,6 +9,9 @@ if TYPE_CHECKING:
     from ..models import Listing
 from dataclasses import dataclass, field
 
+from ..keywords import KeywordMatcher
+from ..listing_utils import promoted_payload_fields
+
 
 @dataclass
 class ListingSignals:
@@ -118,6 +121,18 @@ _SUITE_KEYWORDS: set[str] = {
     "secondary",
 }
 
+# Every signal keyword set in one matcher: a single hits() call per description
+_SIGNAL_MATCHER = KeywordMatcher(
+    _MULTI_UNIT_KEYWORDS
+    | set(_UNIT_COUNT_MAP)
+    | _CONDO_KEYWORDS
+    | _UTILITIES_INCLUDED_KEYWORDS
+    | _TENANT_PAYS_UTILITIES_KEYWORDS
+    | _LEGAL_POSITIVE_KEYWORDS
+    | _LEGAL_NEGATIVE_KEYWORDS
+    | _SUITE_KEYWORDS
+)
+
 # Condo fee sane range (CAD)
 _CONDO_FEE_MIN = 50
 _CONDO_FEE_MAX = 2000
@@ -150,9 +165,11 @@ def _parse_condo_fee(text: str) -> float | None:
     return None
 
 
-def _has_suite_context(text: str) -> bool:
-    """Return True if text contains suite-related keywords."""
-    return any(kw in text for kw in _SUITE_KEYWORDS)
+def _has_suite_context(text: str, hits: set[str] | None = None) -> bool:
+    """Return True if text contains suite-related keywords (*hits*: precomputed matcher hits)."""
+    if hits is None:
+        hits = _SIGNAL_MATCHER.hits(text)
+    return not hits.isdisjoint(_SUITE_KEYWORDS)
 
 
 def _extract_hoa_from_payload(raw_payload: dict | None) -> float | None:
@@ -161,30 +178,26 @@ def _extract_hoa_from_payload(raw_payload: dict | None) -> float | None:
     Redfin stores HOA/condo fees at ``homeData.hoaDues.amount`` (string).
     Returns the monthly amount if within the sane range, else None.
     """
-    if not raw_payload or not isinstance(raw_payload, dict):
-        return None
-    hd = raw_payload.get("homeData") or raw_payload
-    hoa = hd.get("hoaDues") or {}
-    amt_str = hoa.get("amount")
-    if not amt_str:
-        return None
-    try:
-        val = float(str(amt_str).replace(",", ""))
-        if _CONDO_FEE_MIN <= val <= _CONDO_FEE_MAX:
-            return val
-    except (ValueError, TypeError):
-        pass
+    return _sane_hoa(promoted_payload_fields(raw_payload)["hoa_dues"])
+
+
+def _sane_hoa(val: float | None) -> float | None:
+    """Monthly HOA/condo fee if within the sane range, else None."""
+    if val is not None and _CONDO_FEE_MIN <= val <= _CONDO_FEE_MAX:
+        return val
     return None
 
 
 def extract_signals(
     description: str | None,
     raw_payload: dict | None = None,
+    hoa_dues: float | None = None,
 ) -> ListingSignals:
     """Extract structured signals from a listing description and raw API payload.
 
     Uses conservative keyword matching on the description text.
-    Also checks ``raw_payload`` for structured data (e.g. Redfin ``hoaDues``).
+    Also checks structured data (Redfin ``hoaDues``): the promoted ``hoa_dues``
+    when given, else ``raw_payload``.
     """
     notes: list[str] = []
     text = _normalize(description or "")
@@ -193,22 +206,24 @@ def extract_signals(
     # (caller will set based on parse_rent_from_description result)
     explicit_rent_found = False
 
+    hits = _SIGNAL_MATCHER.hits(text)
+
     # Multi-unit signal
-    multi_unit_signal = any(kw in text for kw in _MULTI_UNIT_KEYWORDS)
+    multi_unit_signal = not hits.isdisjoint(_MULTI_UNIT_KEYWORDS)
 
     # Unit count hint
     unit_count_hint: int | None = None
     for kw, count in _UNIT_COUNT_MAP.items():
-        if kw in text:
+        if kw in hits:
             unit_count_hint = count
             break
 
     # Condo signal
-    condo_signal = any(kw in text for kw in _CONDO_KEYWORDS)
+    condo_signal = not hits.isdisjoint(_CONDO_KEYWORDS)
 
     # Condo fee: prefer structured API data, fall back to description parsing
     condo_fee_monthly: float | None = None
-    hoa_from_api = _extract_hoa_from_payload(raw_payload)
+    hoa_from_api = _sane_hoa(hoa_dues) if hoa_dues is not None else _extract_hoa_from_payload(raw_payload)
     if hoa_from_api is not None:
         condo_fee_monthly = hoa_from_api
         condo_signal = True
@@ -219,8 +234,8 @@ def extract_signals(
             notes.append(f"condo_fee_parsed={condo_fee_monthly}")
 
     # Utilities
-    has_included = any(kw in text for kw in _UTILITIES_INCLUDED_KEYWORDS)
-    has_tenant_pays = any(kw in text for kw in _TENANT_PAYS_UTILITIES_KEYWORDS)
+    has_included = not hits.isdisjoint(_UTILITIES_INCLUDED_KEYWORDS)
+    has_tenant_pays = not hits.isdisjoint(_TENANT_PAYS_UTILITIES_KEYWORDS)
     if has_included and has_tenant_pays:
         utilities_included = None
         tenant_pays_utilities = None
@@ -231,9 +246,9 @@ def extract_signals(
 
     # Legal suite signal
     legal_suite_signal: bool | None = None
-    if _has_suite_context(text):
-        has_legal_pos = any(kw in text for kw in _LEGAL_POSITIVE_KEYWORDS)
-        has_legal_neg = any(kw in text for kw in _LEGAL_NEGATIVE_KEYWORDS)
+    if _has_suite_context(text, hits):
+        has_legal_pos = not hits.isdisjoint(_LEGAL_POSITIVE_KEYWORDS)
+        has_legal_neg = not hits.isdisjoint(_LEGAL_NEGATIVE_KEYWORDS)
         if has_legal_pos and not has_legal_neg:
             legal_suite_signal = True
             notes.append("legal_suite_positive")